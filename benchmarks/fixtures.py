@@ -0,0 +1,228 @@
+"""Data Dragon and CommunityDragon fixtures served from a local directory.
+
+Fixtures use the same layout as the real servers, the ddragon files living in the root of the directory and the
+CommunityDragon files in its cdragon subfolder:
+    api/versions.json
+    cdn/{version}/data/{locale}/{file}.json
+    cdragon/latest/plugins/rcp-be-lol-game-data/global/{cdragon_locale}/v1/perks.json
+
+They are either generated with generate_fixtures() or recorded from the real servers with
+    python -m benchmarks.fixtures DIRECTORY --versions 12.1.1,12.2.1 --locales en_US,ko_KR
+"""
+import argparse
+import functools
+import json
+import os
+import random
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+ddragon_files = ["champion", "item", "runesReforged", "summoner"]
+
+DEFAULT_LOCALES = ["en_US", "ko_KR", "fr_FR"]
+DEFAULT_VERSION_COUNT = 30
+
+# Roughly the number of objects in a recent patch
+OBJECT_COUNTS = {"champion": 160, "item": 240, "rune": 60, "summoner": 16}
+
+SYLLABLES = {
+    "en_US": "ka ra sh ian mor dra ven el ith or ze lu tha gar is no".split(),
+    "ko_KR": "가 라 사 이 모 드 벤 엘 스 오 제 루 타 갈 니 노".split(),
+    "fr_FR": "ca ré ch ien mor dra vè el ith or zé lu tha gar is no".split(),
+}
+
+
+def get_fixture_path(directory: str, url_path: str) -> str:
+    return os.path.join(directory, *url_path.split("/"))
+
+
+def get_cdragon_locale(locale: str) -> str:
+    return locale.lower() if locale != "en_US" else "default"
+
+
+def write_json(location: str, data):
+    os.makedirs(os.path.dirname(location), exist_ok=True)
+
+    with open(location, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False)
+
+
+def generate_name(rng: random.Random, locale: str) -> str:
+    syllables = SYLLABLES.get(locale, SYLLABLES["en_US"])
+
+    words = [
+        "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        for _ in range(rng.choice([1, 1, 1, 2, 3]))
+    ]
+
+    return " ".join(word.capitalize() for word in words)
+
+
+def generate_names(locale: str, version_index: int) -> Dict[str, Dict[int, str]]:
+    """Returns {object_type: {id: name}}, a few objects being renamed every version."""
+    rng = random.Random(locale)
+
+    ids = {
+        "champion": range(1, OBJECT_COUNTS["champion"] + 1),
+        "item": range(1001, 1001 + OBJECT_COUNTS["item"]),
+        "rune": range(8001, 8001 + OBJECT_COUNTS["rune"]),
+        "summoner": range(1, OBJECT_COUNTS["summoner"] + 1),
+    }
+
+    names = {
+        object_type: {id_: generate_name(rng, locale) for id_ in object_ids}
+        for object_type, object_ids in ids.items()
+    }
+
+    for index in range(version_index):
+        version_rng = random.Random(f"{locale}{index}")
+        for object_type in names:
+            id_ = version_rng.choice(list(names[object_type]))
+            names[object_type][id_] = generate_name(version_rng, locale)
+
+    return names
+
+
+def generate_fixtures(
+    directory: str,
+    locales: List[str] = None,
+    version_count: int = DEFAULT_VERSION_COUNT,
+) -> List[str]:
+    """Generates synthetic fixtures in the directory and returns their versions, most recent first.
+
+    Every locale is available for the latest version and en_US for all of them.
+    """
+    locales = locales or DEFAULT_LOCALES
+    versions = [f"12.{minor}.1" for minor in range(version_count, 0, -1)]
+
+    write_json(get_fixture_path(directory, "api/versions.json"), versions)
+
+    for version_index, version in enumerate(reversed(versions)):
+        version_locales = locales if version == versions[0] else ["en_US"]
+
+        for locale in version_locales:
+            names = generate_names(locale, version_index)
+
+            files = {
+                "champion": {
+                    "data": {
+                        f"Champion{id_}": {"key": str(id_), "name": name}
+                        for id_, name in names["champion"].items()
+                    }
+                },
+                "item": {
+                    "data": {
+                        str(id_): {"name": name, "tags": []}
+                        for id_, name in names["item"].items()
+                    }
+                },
+                "runesReforged": [
+                    {
+                        "id": 8000 + tree * 100,
+                        "name": f"{locale} tree {tree}",
+                        "slots": [
+                            {
+                                "runes": [
+                                    {"id": id_, "name": name}
+                                    for id_, name in names["rune"].items()
+                                    if id_ % 5 == tree
+                                ]
+                            }
+                        ],
+                    }
+                    for tree in range(5)
+                ],
+                "summoner": {
+                    "data": {
+                        f"Summoner{id_}": {"key": str(id_), "name": name}
+                        for id_, name in names["summoner"].items()
+                    }
+                },
+            }
+
+            for file_name, data in files.items():
+                write_json(
+                    get_fixture_path(
+                        directory, f"cdn/{version}/data/{locale}/{file_name}.json"
+                    ),
+                    data,
+                )
+
+    for locale in locales:
+        perks = [
+            {"id": 5001 + index, "name": f"{locale} shard {index}"}
+            for index in range(8)
+        ]
+        write_json(
+            get_fixture_path(
+                directory,
+                f"cdragon/latest/plugins/rcp-be-lol-game-data/global/{get_cdragon_locale(locale)}/v1/perks.json",
+            ),
+            perks,
+        )
+
+    return versions
+
+
+def record_fixtures(directory: str, versions: List[str], locales: List[str]):
+    """Downloads the given versions and locales from Data Dragon and CommunityDragon into the directory."""
+    from lol_id_tools.http_client import get_json
+    from lol_id_tools.parsing import parse_ddragon
+
+    def record(url_path: str, url: str):
+        write_json(get_fixture_path(directory, url_path), get_json(url))
+
+    record("api/versions.json", parse_ddragon.get_versions_url())
+
+    for version in versions:
+        for locale in locales:
+            for file_name in ddragon_files:
+                record(
+                    f"cdn/{version}/data/{locale}/{file_name}.json",
+                    parse_ddragon.get_ddragon_url(version, locale, file_name),
+                )
+
+    for locale in locales:
+        url = parse_ddragon.get_cdragon_perks_url(locale)
+        record("cdragon" + url[len(parse_ddragon.CDRAGON_URL) :], url)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_fixtures(directory: str) -> ThreadingHTTPServer:
+    """Serves the fixtures on a free local port from a daemon thread, stopped with server.shutdown()."""
+    handler = functools.partial(QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def get_server_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def use_fixtures(server_url: str):
+    """Points the package to fixtures served at server_url."""
+    from lol_id_tools.parsing import parse_ddragon
+
+    parse_ddragon.DDRAGON_URL = server_url
+    parse_ddragon.CDRAGON_URL = f"{server_url}/cdragon"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Records Data Dragon fixtures.")
+    parser.add_argument("directory")
+    parser.add_argument(
+        "--versions", required=True, help="comma-separated full versions"
+    )
+    parser.add_argument("--locales", default="en_US", help="comma-separated locales")
+    args = parser.parse_args()
+
+    record_fixtures(args.directory, args.versions.split(","), args.locales.split(","))
@@ -0,0 +1,414 @@
+"""Offline benchmarks of the lookup, load, import, and startup paths.
+
+Data Dragon fixtures are served locally and the package saves its data in a temporary home folder, so runs never
+touch the network or the local ~/.config/lol_id_tools folder.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json
+"""
+import argparse
+import gc
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from benchmarks.fixtures import (
+    generate_fixtures,
+    get_server_url,
+    serve_fixtures,
+    use_fixtures,
+)
+
+# Relative slowdown of the median over which a benchmark is reported as a regression
+DEFAULT_THRESHOLD = 0.2
+
+# Seconds a fresh interpreter may take to import the package, which only loads its dependencies on first use
+IMPORT_BUDGET = 0.05
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import lol_id_tools
+print(time.perf_counter() - start)
+"""
+
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import lol_id_tools as lit
+lit.get_id(sys.argv[1])
+print(time.perf_counter() - start)
+"""
+
+
+class Benchmark(NamedTuple):
+    name: str
+    operation: Callable[[], None]
+    number: int
+
+
+class Result(NamedTuple):
+    median: float
+    minimum: float
+    memory: int
+
+
+def measure(benchmark: Benchmark, repeat: int, number: int) -> Result:
+    """Times number operations repeat times, then traces the memory allocated by a single operation."""
+    timings = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(number):
+            benchmark.operation()
+        timings.append((time.perf_counter() - start) / number)
+
+    gc.collect()
+    tracemalloc.start()
+    benchmark.operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(statistics.median(timings), min(timings), peak)
+
+
+def measure_script(home: str, script: str, repeat: int, *args: str) -> Result:
+    """Runs a script timing part of its own execution in fresh interpreters, like importing the package."""
+    env = dict(os.environ, HOME=home, USERPROFILE=home)
+
+    def run_script(*options: str) -> float:
+        output = subprocess.run(
+            [sys.executable, *options, "-c", script, *args],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return float(output.split()[-1])
+
+    timings = [run_script() for _ in range(repeat)]
+
+    # Peak memory is measured by tracing allocations from interpreter start
+    memory_script = script.replace(
+        "print(time.perf_counter() - start)",
+        "import tracemalloc; print(tracemalloc.get_traced_memory()[1])",
+    )
+    output = subprocess.run(
+        [sys.executable, "-X", "tracemalloc", "-c", memory_script, *args],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return Result(statistics.median(timings), min(timings), int(output.split()[-1]))
+
+
+def cycle(values: list) -> Callable[[], object]:
+    return itertools.cycle(values).__next__
+
+
+def misspell(rng: random.Random, name: str) -> str:
+    """Returns the name with a random character dropped, which exact matching cannot find."""
+    index = rng.randrange(len(name))
+    return (name[:index] + name[index + 1 :]).lower()
+
+
+def get_benchmarks(versions: List[str]) -> List[Benchmark]:
+    import lol_id_tools as lit
+    from lol_id_tools import get_simple_id
+    from lol_id_tools.functions import lod
+    from lol_id_tools.http_client import client
+    from lol_id_tools.patch_history import PatchHistory
+
+    rng = random.Random(0)
+
+    def get_names(locale: str, object_type: str) -> List[str]:
+        return [
+            objects[object_type]
+            for objects in lod.get_locale_data(locale).values()
+            if object_type in objects
+        ]
+
+    item_ids = [
+        id_
+        for id_, objects in lod.get_locale_data("en_US").items()
+        if "item" in objects
+    ]
+    names = get_names("en_US", "champion") + get_names("en_US", "item")
+    misspelled_names = [misspell(rng, name) for name in names]
+    korean_names = [misspell(rng, name) for name in get_names("ko_KR", "champion")]
+
+    next_name = cycle(names)
+    next_misspelled_name = cycle(misspelled_names)
+    next_korean_name = cycle(korean_names)
+    next_item_id = cycle(item_ids)
+    next_patch = cycle([version.rsplit(".", 1)[0] for version in versions])
+    next_version = cycle(versions)
+    next_versioned_name = cycle(
+        [
+            (version, lit.get_name(id_, object_type="champion", patch=version))
+            for version in versions
+            for id_ in range(1, 6)
+        ]
+    )
+
+    def versioned_id():
+        version, name = next_versioned_name()
+        lit.get_id(name, patch=version)
+
+    def get_id_fuzzy():
+        lit.fuzzy_cache.clear()
+        lit.get_id(next_misspelled_name(), minimum_score=0)
+
+    def get_id_filtered():
+        lit.fuzzy_cache.clear()
+        lit.get_id(
+            next_korean_name(),
+            minimum_score=0,
+            input_locale="ko_KR",
+            object_type="champion",
+        )
+
+    def load_locale():
+        # Forgetting ETags so that every file is downloaded again
+        client.responses.clear()
+        lod.load_locale("fr_FR")
+
+    def versioned_name_disk():
+        # Forgetting the loaded history so that it is read from disk again
+        history = PatchHistory(
+            get_simple_id.history.location, get_simple_id.get_patch_data
+        )
+        history.get_name(1, "champion", next_version())
+
+    return [
+        Benchmark("get_id_exact", lambda: lit.get_id(next_name()), 5000),
+        Benchmark("get_id_fuzzy", get_id_fuzzy, 200),
+        Benchmark(
+            "get_id_fuzzy_cached",
+            lambda: lit.get_id(next_misspelled_name(), minimum_score=0),
+            5000,
+        ),
+        Benchmark("get_id_filtered", get_id_filtered, 200),
+        Benchmark("get_name", lambda: lit.get_name(next_item_id()), 5000),
+        Benchmark(
+            "get_name_locale", lambda: lit.get_name(next_item_id(), "ko_KR"), 5000
+        ),
+        Benchmark(
+            "get_translation",
+            lambda: lit.get_translation(next_name(), "ko_KR"),
+            5000,
+        ),
+        Benchmark("recalculate_names_to_id", lod.recalculate_names_to_id, 20),
+        Benchmark("load_locale", load_locale, 5),
+        Benchmark(
+            "versioned_name",
+            lambda: lit.VersionedNameGetter(next_patch()).get_name(1, "champion"),
+            5000,
+        ),
+        Benchmark("versioned_id", versioned_id, 5000),
+        Benchmark("versioned_name_disk", versioned_name_disk, 20),
+    ]
+
+
+def get_recorded_versions(fixtures: str) -> List[str]:
+    """Returns the versions recorded in the fixtures folder, most recent first."""
+    with open(os.path.join(fixtures, "api", "versions.json")) as file:
+        versions = json.load(file)
+
+    return [v for v in versions if os.path.isdir(os.path.join(fixtures, "cdn", v))]
+
+
+def run_benchmarks(
+    repeat: int = 5,
+    quick: bool = False,
+    filters: List[str] = None,
+    fixtures: str = None,
+) -> Dict[str, Result]:
+    """Runs the benchmarks in a temporary home folder and returns their results.
+
+    Fixtures are generated unless a folder of recorded fixtures is given, whose latest version needs the en_US, ko_KR
+    and fr_FR locales.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        home = os.path.join(directory, "home")
+
+        # The package reads its save folder from HOME on first use, which has to happen after HOME is changed
+        os.environ["HOME"] = os.environ["USERPROFILE"] = home
+
+        if fixtures:
+            versions = get_recorded_versions(fixtures)
+        else:
+            fixtures = os.path.join(directory, "fixtures")
+            versions = generate_fixtures(fixtures)
+
+        server = serve_fixtures(fixtures)
+
+        try:
+            use_fixtures(get_server_url(server))
+
+            import lol_id_tools as lit
+            from lol_id_tools.logger import lit_logger
+
+            # Warnings about IDs shared by several object types would be logged in the timed loops
+            lit_logger.setLevel(logging.ERROR)
+
+            lit.preload(
+                locales=["en_US", "ko_KR", "fr_FR"],
+                patches=[f"{versions[-1]}-{versions[0]}"],
+            )
+
+            results = {}
+
+            for benchmark in get_benchmarks(versions):
+                if filters and not any(f in benchmark.name for f in filters):
+                    continue
+
+                number = 1 if quick else benchmark.number
+                results[benchmark.name] = measure(
+                    benchmark, 1 if quick else repeat, number
+                )
+
+            if not filters or any(f in "import" for f in filters):
+                results["import"] = measure_script(
+                    home, IMPORT_SCRIPT, 1 if quick else repeat
+                )
+
+            if not filters or any(f in "startup" for f in filters):
+                name = lit.get_name(1, object_type="champion")
+                results["startup"] = measure_script(
+                    home, STARTUP_SCRIPT, 1 if quick else repeat, name
+                )
+
+        finally:
+            server.shutdown()
+
+    return results
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def format_memory(size: int) -> str:
+    for unit, scale in [("MiB", 1024**2), ("KiB", 1024)]:
+        if size >= scale:
+            return f"{size / scale:.1f}{unit}"
+    return f"{size}B"
+
+
+def compare(
+    results: Dict[str, Result], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """Prints the results next to the baseline and returns the names of the benchmarks that regressed."""
+    regressions = []
+
+    print(
+        f"{'benchmark':<26}{'median':>12}{'baseline':>12}{'change':>10}{'memory':>12}"
+    )
+    for name, result in results.items():
+        base: Optional[dict] = baseline.get(name)
+
+        if base is None:
+            print(f"{name:<26}{format_time(result.median):>12}{'-':>12}{'-':>10}")
+            continue
+
+        change = result.median / base["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+
+        print(
+            f"{name:<26}{format_time(result.median):>12}{format_time(base['median']):>12}"
+            f"{change:>+10.0%}{format_memory(result.memory):>12}{flag}"
+        )
+
+    return regressions
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timing rounds per benchmark"
+    )
+    parser.add_argument("--quick", action="store_true", help="run every operation once")
+    parser.add_argument(
+        "--filter", action="append", help="only run benchmarks containing this string"
+    )
+    parser.add_argument(
+        "--fixtures", help="folder of fixtures recorded with benchmarks.fixtures"
+    )
+    parser.add_argument("--save", help="save the results as a baseline to this file")
+    parser.add_argument(
+        "--compare", help="compare the results to a baseline saved with --save"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.repeat, args.quick, args.filter, args.fixtures)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            sys.exit(1)
+
+    else:
+        print(f"{'benchmark':<26}{'median':>12}{'min':>12}{'memory':>12}")
+        for name, result in results.items():
+            print(
+                f"{name:<26}{format_time(result.median):>12}{format_time(result.minimum):>12}"
+                f"{format_memory(result.memory):>12}"
+            )
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": {
+                        name: result._asdict() for name, result in results.items()
+                    },
+                },
+                file,
+                indent=2,
+            )
+
+    # Import time is held to a fixed budget rather than to a baseline, as it is paid by every process using the package
+    if "import" in results and results["import"].median > IMPORT_BUDGET:
+        print(
+            f"Importing the package took {format_time(results['import'].median)}, "
+            f"over the {format_time(IMPORT_BUDGET)} budget"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
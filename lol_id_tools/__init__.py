@@ -1,7 +1,83 @@
-from lol_id_tools.functions import (
-    get_id,
-    get_name,
-    get_translation,
-    NoMatchingNameFound,
-    VersionedNameGetter,
+import importlib
+from typing import TYPE_CHECKING
+
+# preload() is named like its module, which would replace it as an attribute of the package once imported
+# The module only imports what it needs when called, so it is imported right away
+from lol_id_tools.preload import (
+    preload,
+    start_background_refresh,
+    stop_background_refresh,
 )
+
+# Public names and the module they come from, which is only imported on first use
+# This keeps `import lol_id_tools` from importing rapidfuzz, numpy and requests, or touching the file system
+_lazy_imports = {
+    "get_id": "lol_id_tools.functions",
+    "get_id_candidates": "lol_id_tools.functions",
+    "get_ids": "lol_id_tools.functions",
+    "get_name": "lol_id_tools.functions",
+    "get_names": "lol_id_tools.functions",
+    "get_translation": "lol_id_tools.functions",
+    "get_translations": "lol_id_tools.functions",
+    "NoMatchingNameFound": "lol_id_tools.functions",
+    "VersionedNameGetter": "lol_id_tools.functions",
+    "fuzzy_cache": "lol_id_tools.functions",
+    "missing_cache": "lol_id_tools.functions",
+    "aget_id": "lol_id_tools.async_functions",
+    "aget_name": "lol_id_tools.async_functions",
+    "aget_translation": "lol_id_tools.async_functions",
+    "configure_http": "lol_id_tools.http_client",
+    "enable_metrics": "lol_id_tools.metrics",
+    "MetricsRecorder": "lol_id_tools.metrics",
+}
+
+__all__ = [
+    *_lazy_imports,
+    "preload",
+    "start_background_refresh",
+    "stop_background_refresh",
+]
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+    elif name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        # Submodules like lol_id_tools.functions are also imported on first use
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    # Caching the attribute, so that the next accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_imports})
+
+
+if TYPE_CHECKING:
+    from lol_id_tools.functions import (
+        get_id,
+        get_id_candidates,
+        get_ids,
+        get_name,
+        get_names,
+        get_translation,
+        get_translations,
+        NoMatchingNameFound,
+        VersionedNameGetter,
+        fuzzy_cache,
+        missing_cache,
+    )
+    from lol_id_tools.async_functions import aget_id, aget_name, aget_translation
+    from lol_id_tools.http_client import configure_http
+    from lol_id_tools.metrics import enable_metrics, MetricsRecorder
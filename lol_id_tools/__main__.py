@@ -0,0 +1,3 @@
+from lol_id_tools.cli import main
+
+main()
@@ -0,0 +1,118 @@
+import asyncio
+from functools import partial
+from typing import Optional
+
+from lol_id_tools.functions import (
+    NoMatchingNameFound,
+    get_id,
+    get_name,
+    lod,
+)
+from lol_id_tools.parsing.local_data_parser import get_clean_locale
+
+
+async def run_in_thread(function, *args, **kwargs):
+    """Runs a blocking function in the default executor of the running loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(function, *args, **kwargs))
+
+
+async def aget_name(
+    input_id: int,
+    output_locale: str = "en_US",
+    object_type=None,
+    retry=True,
+    fallback_to_none=True,
+    patch: str = None,
+) -> Optional[str]:
+    """Asynchronous version of get_name().
+
+    Lookups in loaded data never await, missing locales are loaded concurrently on the event loop, and reloads
+    triggered by misses are run in a thread.
+
+    Usage example:
+        await aget_name(21)
+        await aget_name(21, 'ko_KR')
+    """
+    if patch:
+        return await run_in_thread(
+            get_name, input_id, output_locale, object_type, patch=patch
+        )
+
+    await lod.aload_saved_data()
+
+    output_locale = get_clean_locale(output_locale)
+
+    if output_locale not in lod.loaded_locales:
+        await lod.aload_locale(output_locale)
+
+    try:
+        return get_name(input_id, output_locale, object_type, False, False)
+    except KeyError:
+        if not retry:
+            return get_name(
+                input_id, output_locale, object_type, False, fallback_to_none
+            )
+
+    return await run_in_thread(
+        get_name, input_id, output_locale, object_type, retry, fallback_to_none
+    )
+
+
+async def aget_id(
+    input_str: str,
+    minimum_score: int = 75,
+    input_locale: str = None,
+    object_type: str = None,
+    retry: bool = True,
+) -> int:
+    """Asynchronous version of get_id().
+
+    Lookups in loaded data never await, missing locales are loaded concurrently on the event loop, and reloads
+    triggered by misses are run in a thread.
+
+    Usage example:
+        await aget_id('Miss Fortune')
+        await aget_id('미스 포츈', input_locale='ko_KR')
+    """
+    await lod.aload_saved_data()
+
+    if input_locale:
+        locale = get_clean_locale(input_locale)
+        if locale not in lod.loaded_locales:
+            await lod.aload_locale(locale)
+
+    # If we run aget_id() with no locale and nothing is loaded, we load english by default.
+    elif not lod.loaded_locales:
+        await lod.aload_locale("en_US")
+
+    try:
+        return get_id(input_str, minimum_score, input_locale, object_type, False)
+    except NoMatchingNameFound:
+        if not retry:
+            raise
+
+    return await run_in_thread(
+        get_id, input_str, minimum_score, input_locale, object_type, retry
+    )
+
+
+async def aget_translation(
+    object_name: str,
+    output_locale: str = "en_US",
+    minimum_score: int = 75,
+    input_locale: str = None,
+    object_type: str = None,
+    retry: bool = True,
+) -> str:
+    """Asynchronous version of get_translation().
+
+    Usage example:
+        await aget_translation('미스 포츈')
+        await aget_translation('Miss Fortune', 'ko_KR')
+    """
+    object_id = await aget_id(
+        object_name, minimum_score, input_locale, object_type, retry
+    )
+
+    return await aget_name(object_id, output_locale)
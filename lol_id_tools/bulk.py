@@ -0,0 +1,206 @@
+import csv
+import itertools
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+# Number of rows read, translated and written at once, which bounds the memory used whatever the size of the input
+DEFAULT_CHUNK_SIZE = 10000
+
+modes = ["id", "name", "translation"]
+
+
+def get_mapper(
+    mode: str,
+    output_locale: str = "en_US",
+    minimum_score: int = 75,
+    input_locale: str = None,
+    object_type: str = None,
+    patch: str = None,
+    workers: int = 1,
+) -> Callable[[List[Any]], List[Any]]:
+    """Returns a function mapping a list of unique values to their ids, names, or translations.
+
+    Values that cannot be found are mapped to None. Names can be of any scalar type, like numbers in JSON Lines files.
+    """
+    # Imported on first use so that the command line parses its arguments without loading the lookup functions
+    from lol_id_tools.functions import (
+        VersionedNameGetter,
+        get_ids,
+        get_names,
+        get_translations,
+    )
+
+    if patch and mode != "name":
+        raise ValueError("Patches can only be used to get names from ids.")
+
+    if patch and not object_type:
+        raise ValueError("An object_type is required to get names at a given patch.")
+
+    if mode == "id":
+        return lambda values: get_ids(
+            [str(value) for value in values],
+            minimum_score,
+            input_locale,
+            object_type,
+            fallback_to_none=True,
+            workers=workers,
+        )
+
+    elif mode == "translation":
+        return lambda values: get_translations(
+            [str(value) for value in values],
+            output_locale,
+            minimum_score,
+            input_locale,
+            object_type,
+            fallback_to_none=True,
+            workers=workers,
+        )
+
+    elif mode == "name":
+        if patch:
+            getter = VersionedNameGetter(patch)
+
+            def map_versioned_names(values: List[Any]) -> List[Optional[str]]:
+                names = []
+                for value in values:
+                    try:
+                        names.append(getter.get_name(int(value), object_type))
+                    except (KeyError, ValueError):
+                        names.append(None)
+                return names
+
+            return map_versioned_names
+
+        def map_names(values: List[Any]) -> List[Optional[str]]:
+            ids = [cast_id(value) for value in values]
+            valid_ids = [id_ for id_ in ids if id_ is not None]
+            names = dict(
+                zip(valid_ids, get_names(valid_ids, output_locale, object_type))
+            )
+            return [names.get(id_) for id_ in ids]
+
+        return map_names
+
+    raise ValueError(f"Unknown mode {mode}, expected one of {modes}.")
+
+
+def cast_id(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def is_mappable(value: Any) -> bool:
+    """Returns whether the value is a non-empty string or number, other JSON values being mapped to None."""
+    return (
+        isinstance(value, (str, int, float))
+        and not isinstance(value, bool)
+        and value != ""
+    )
+
+
+def map_rows(
+    rows: Iterable[Dict[str, Any]],
+    columns: List[str],
+    mapper: Callable[[List[Any]], List[Any]],
+    suffix: str = "",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Maps the given columns of the rows, resolving each distinct value once per chunk.
+
+    Rows are consumed lazily and only chunk_size of them are held in memory at any time. Empty values are kept as they
+    are, and booleans, lists, and objects are mapped to None.
+
+    Args:
+        rows: Rows as dictionaries, like the ones returned by csv.DictReader
+        columns: Columns whose values are mapped
+        mapper: Function mapping a list of unique values to their results, as returned by get_mapper()
+        suffix: Suffix of the columns the results are written to, with "" replacing the input values
+        chunk_size: Number of rows mapped at once
+
+    Returns:
+        The mapped rows, in the same order as the input
+    """
+    rows = iter(rows)
+
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+
+        values = list(
+            dict.fromkeys(
+                row[column]
+                for row in chunk
+                for column in columns
+                if is_mappable(row.get(column))
+            )
+        )
+        results = dict(zip(values, mapper(values))) if values else {}
+
+        for row in chunk:
+            for column in columns:
+                value = row.get(column)
+                if value in (None, ""):
+                    row[column + suffix] = value
+                elif is_mappable(value):
+                    row[column + suffix] = results.get(value)
+                else:
+                    row[column + suffix] = None
+
+        yield from chunk
+
+
+def translate_csv(
+    input_file: TextIO,
+    output_file: TextIO,
+    columns: List[str],
+    mapper: Callable[[List[Any]], List[Any]],
+    suffix: str = "",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Streams a CSV file with a header line, mapping the given columns."""
+    reader = csv.DictReader(input_file)
+
+    if reader.fieldnames is None:
+        return
+
+    missing_columns = [c for c in columns if c not in reader.fieldnames]
+    if missing_columns:
+        raise ValueError(f"Columns {missing_columns} not found in the CSV header.")
+
+    fieldnames = reader.fieldnames + [
+        column + suffix
+        for column in columns
+        if column + suffix not in reader.fieldnames
+    ]
+
+    writer = csv.DictWriter(output_file, fieldnames, lineterminator="\n")
+    writer.writeheader()
+
+    for index, row in enumerate(map_rows(reader, columns, mapper, suffix, chunk_size)):
+        writer.writerow(row)
+
+        if (index + 1) % chunk_size == 0:
+            output_file.flush()
+
+
+def translate_jsonl(
+    input_file: TextIO,
+    output_file: TextIO,
+    columns: List[str],
+    mapper: Callable[[List[Any]], List[Any]],
+    suffix: str = "",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Streams a JSON Lines file of objects, mapping the given keys."""
+    rows = (json.loads(line) for line in input_file if line.strip())
+
+    for index, row in enumerate(map_rows(rows, columns, mapper, suffix, chunk_size)):
+        output_file.write(json.dumps(row, ensure_ascii=False))
+        output_file.write("\n")
+
+        if (index + 1) % chunk_size == 0:
+            output_file.flush()
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache:
+    """A thread-safe, size-bounded least recently used cache.
+
+    The cache is tied to a data generation, and syncing it to a new generation empties it.
+
+    Args:
+        maxsize: Maximum total size of the values
+        get_size: Function returning the size of a value, every value having a size of 1 if None
+    """
+
+    def __init__(self, maxsize: int = 4096, get_size: Callable[[Any], int] = None):
+        self.maxsize = maxsize
+        self.get_size = get_size
+        self.hits = 0
+        self.misses = 0
+        self.generation = None
+
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+
+            # Every value has a size of at least 1, so that evicting down to a size of 0 empties the cache
+            size = max(self.get_size(value), 1) if self.get_size else 1
+
+            self._size += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            self.evict(self.maxsize)
+
+    def sync(self, generation: Any):
+        """Empties the cache if the data it was computed from changed since the last call."""
+        if generation != self.generation:
+            with self._lock:
+                self.evict(0)
+                self.generation = generation
+
+    def resize(self, maxsize: int):
+        """Changes the maximum number of entries, 0 disabling the cache."""
+        with self._lock:
+            self.maxsize = maxsize
+            self.evict(max(maxsize, 0))
+
+    def clear(self):
+        """Empties the cache and resets its statistics."""
+        with self._lock:
+            self.evict(0)
+            self.hits = 0
+            self.misses = 0
+
+    def evict(self, maxsize: int):
+        """Drops the least recently used values until their total size is at most maxsize, with the lock held."""
+        while self._size > maxsize:
+            key, _ = self._data.popitem(last=False)
+            self._size -= self._sizes.pop(key)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, self._size)
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,203 @@
+import argparse
+import io
+import logging
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, TextIO
+
+from lol_id_tools.bulk import (
+    DEFAULT_CHUNK_SIZE,
+    get_mapper,
+    modes,
+    translate_csv,
+    translate_jsonl,
+)
+
+
+def split_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def warm(args: argparse.Namespace):
+    # Imported here so that parsing arguments and --help do not load the lookup functions
+    from lol_id_tools.functions import lod
+    from lol_id_tools.preload import preload
+
+    if args.sqlite:
+        lod.use_sqlite_store()
+
+    preload(args.locales, args.patches, args.object_types, args.workers)
+
+    print(f"Loaded locales: {', '.join(lod.loaded_locales) or 'none'}")
+
+
+@contextmanager
+def open_text(path: str, mode: str) -> Iterator[TextIO]:
+    if path != "-":
+        with open(path, mode, encoding="utf-8", newline="") as file:
+            yield file
+        return
+
+    # Standard streams are reopened as UTF-8 whatever the platform, and left open afterwards
+    stream = sys.stdin if mode == "r" else sys.stdout
+    file = io.TextIOWrapper(stream.buffer, encoding="utf-8", newline="")
+    try:
+        yield file
+    finally:
+        file.flush()
+        file.detach()
+
+
+def get_format(args: argparse.Namespace) -> str:
+    if args.format:
+        return args.format
+
+    if args.input.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+
+    return "csv"
+
+
+def translate(args: argparse.Namespace):
+    mapper = get_mapper(
+        args.mode,
+        args.locale,
+        args.minimum_score,
+        args.input_locale,
+        args.object_type,
+        args.patch,
+        args.workers,
+    )
+
+    translate_file = translate_jsonl if get_format(args) == "jsonl" else translate_csv
+
+    with open_text(args.input, "r") as input_file, open_text(
+        args.output, "w"
+    ) as output_file:
+        translate_file(
+            input_file,
+            output_file,
+            args.columns,
+            mapper,
+            args.suffix,
+            args.chunk_size,
+        )
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lit", description="League of Legends ID tools."
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="log debug information"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    warm_parser = subparsers.add_parser(
+        "warm",
+        help="load locales and patches ahead of time",
+        description="Loads locales and patches and saves them in ~/.config/lol_id_tools.",
+    )
+    warm_parser.add_argument(
+        "--locales",
+        type=split_list,
+        default=[],
+        help="comma-separated locales, like ko_KR,fr_FR",
+    )
+    warm_parser.add_argument(
+        "--patches",
+        type=split_list,
+        default=[],
+        help="comma-separated patches or patch ranges, like 12.1-12.10",
+    )
+    warm_parser.add_argument(
+        "--object-types",
+        type=split_list,
+        default=None,
+        help="comma-separated object types to build indexes for, all by default",
+    )
+    warm_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="maximum number of locales or patches loaded at once",
+    )
+    warm_parser.add_argument(
+        "--sqlite", action="store_true", help="save the data in the SQLite store"
+    )
+    warm_parser.set_defaults(function=warm)
+
+    translate_parser = subparsers.add_parser(
+        "translate",
+        help="map columns of a CSV or JSONL file to ids, names, or translations",
+        description="Streams a CSV or JSONL file and maps the given columns, writing rows as they are processed.",
+    )
+    translate_parser.add_argument(
+        "input", nargs="?", default="-", help="input file, stdin by default"
+    )
+    translate_parser.add_argument(
+        "-o", "--output", default="-", help="output file, stdout by default"
+    )
+    translate_parser.add_argument(
+        "-c",
+        "--columns",
+        type=split_list,
+        required=True,
+        help="comma-separated columns or keys to map",
+    )
+    translate_parser.add_argument(
+        "-m",
+        "--mode",
+        choices=modes,
+        default="translation",
+        help="get ids from names, names from ids, or translations of names",
+    )
+    translate_parser.add_argument(
+        "--format",
+        choices=["csv", "jsonl"],
+        help="input and output format, guessed from the input file extension by default",
+    )
+    translate_parser.add_argument(
+        "--locale", default="en_US", help="locale of the output names"
+    )
+    translate_parser.add_argument("--input-locale", help="locale of the input names")
+    translate_parser.add_argument("--object-type", help="type of the objects to map")
+    translate_parser.add_argument(
+        "--minimum-score", type=int, default=75, help="minimum fuzzy matching score"
+    )
+    translate_parser.add_argument(
+        "--patch", help="patch to get names at, requires --object-type"
+    )
+    translate_parser.add_argument(
+        "--suffix",
+        default="",
+        help="write results to new columns with this suffix instead of replacing the inputs",
+    )
+    translate_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="number of rows mapped at once",
+    )
+    translate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="fuzzy matching threads, -1 for all cores",
+    )
+    translate_parser.set_defaults(function=translate)
+
+    return parser
+
+
+def main(argv: List[str] = None):
+    args = get_parser().parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    args.function(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,49 @@
-from typing import Optional
-
-from rapidfuzz.process import extractOne
-from lol_id_tools.get_simple_id import get_simple_name
+import time
+from collections import defaultdict, namedtuple
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from rapidfuzz.fuzz import WRatio
+from rapidfuzz.process import cdist, extract, extractOne
+from rapidfuzz.utils import default_process
+from lol_id_tools import metrics
+from lol_id_tools.cache import LRUCache
+from lol_id_tools.get_simple_id import get_simple_id, get_simple_name
 
 from lol_id_tools.logger import lit_logger
 from lol_id_tools.parsing.local_data_parser import get_clean_locale
-from lol_id_tools.parsing.lol_object_data import LolObjectData
+from lol_id_tools.parsing.lol_object_data import LolObjectData, object_types
+from lol_id_tools.parsing.scripts import get_scripts
 
 # Instantiating a LolObjectData object is very light as all its fields are ghost loaded.
 lod = LolObjectData()
 
+# Leaguepedia special cases that are considered as having an ID of 0
+EMPTY_NAMES = {"", "none", "loss of ban", "no item"}
+
+# Fuzzy get_id() results keyed on (input_str, minimum_score, locale, object_type), emptied when the data changes
+fuzzy_cache = LRUCache(maxsize=4096)
+
+# Lookups that still missed right after a reload, which are not worth reloading the data again for
+# Keys are prefixed with the function name, and entries are dropped when a new patch is loaded
+missing_cache = LRUCache(maxsize=65536)
+
+# Number of leftover names scored together in one cdist() call, which bounds the size of the score matrix
+CDIST_CHUNK_SIZE = 256
+
+# Score a shortlisted name needs for get_id() to skip scoring all names, lower scores not being trusted as the best
+SHORTLIST_MIN_SCORE = 90
+
 
 def get_name(
     input_id: int,
@@ -62,28 +96,35 @@ def get_name(
     output_locale = get_clean_locale(output_locale)
 
     # First, we see if the object is there with the given constraints
-    try:
-        if not object_type:
-            if lod.loaded_data[output_locale][input_id].__len__() > 1:
-                warning_text = f"Multiple objects with ID {input_id} found, please inform object_type."
-                lit_logger.warning(warning_text)
-            for object_type in ["champion", "item", "rune", "summoner_spell"]:
-                # Iterating this way to have a priority between object types
-                # TODO Rework that for more readable code
-                if object_type in lod.loaded_data[output_locale][input_id]:
-                    break
-
-        return lod.loaded_data[output_locale][input_id][object_type]
-    except KeyError:
-        pass
+    objects = lod.get_objects(output_locale, input_id)
+
+    if not object_type:
+        if len(objects) > 1:
+            warning_text = (
+                f"Multiple objects with ID {input_id} found, please inform object_type."
+            )
+            lit_logger.warning(warning_text)
+
+        # Iterating this way to have a priority between object types
+        object_type = next((t for t in object_types if t in objects), None)
+
+    if object_type in objects:
+        return objects[object_type]
 
     if output_locale not in lod.loaded_locales:
         lod.load_locale(output_locale)
-        return get_name(input_id, output_locale, retry=False)
+        return get_name(input_id, output_locale, object_type, False, fallback_to_none)
+
+    missing_cache.sync(lod.loaded_version)
+    missing_key = ("get_name", input_id, output_locale, object_type)
 
-    if retry:
-        lod.reload_all_locales()
-        return get_name(input_id, output_locale, retry=False)
+    if retry and not missing_cache.get(missing_key) and lod.refresh():
+        try:
+            name = get_name(input_id, output_locale, object_type, False, False)
+        except KeyError:
+            missing_cache.set(missing_key, True)
+        else:
+            return name
 
     error_text = f"Riot object with id {input_id} could not be found."
 
@@ -94,6 +135,90 @@ def get_name(
         return None
 
 
+def get_names(
+    input_ids: Union[Sequence[int], np.ndarray],
+    output_locale: str = "en_US",
+    object_type: str = None,
+    retry: bool = True,
+    fallback_to_none: bool = True,
+) -> Union[List[Optional[str]], np.ndarray]:
+    """Gets you the names of many Riot objects at once.
+
+    Vectorized version of get_name(), resolving all IDs through a precomputed sorted array of the locale's IDs.
+
+    Args:
+        input_ids: Riot IDs of the objects, as a list or a NumPy integer array
+        output_locale: Locale of the output
+        object_type: specifics the object type you want the names of, in ['champion', 'item', 'rune', 'summoner_spell']
+        retry: Optional variable specifying if local_data should be reloaded once if some objects cannot be found
+        fallback_to_none: whether the tool returns None for IDs that cannot be found instead of raising a KeyError
+
+    Returns:
+        The matching object names, as a NumPy object array if input_ids was an array and as a list otherwise.
+
+    Raises:
+        KeyError: An object was not found.
+        ValueError: The locale was not understood properly.
+
+    Usage example:
+        get_names([21, 3153, 0])
+        get_names(match_history["item_0"].to_numpy(), 'ko_KR', object_type='item')
+    """
+    try:
+        ids = np.asarray(input_ids, dtype=np.int64)
+    except (ValueError, TypeError):
+        raise ValueError(f"{input_ids} could not be cast to an integer array.")
+
+    output_locale = get_clean_locale(output_locale)
+
+    if output_locale not in lod.loaded_locales:
+        lod.load_locale(output_locale)
+
+    names = lookup_names(ids, output_locale, object_type)
+    missing = np.equal(names, None)
+
+    if missing.any() and retry:
+        missing_cache.sync(lod.loaded_version)
+        missing_keys = [
+            ("get_name", id_, output_locale, object_type)
+            for id_ in np.unique(ids[missing]).tolist()
+        ]
+
+        if not all(missing_cache.get(key) for key in missing_keys) and lod.refresh():
+            names = lookup_names(ids, output_locale, object_type)
+            missing = np.equal(names, None)
+
+            for id_ in np.unique(ids[missing]).tolist():
+                missing_cache.set(("get_name", id_, output_locale, object_type), True)
+
+    if missing.any():
+        error_text = f"Riot objects with ids {np.unique(ids[missing]).tolist()} could not be found."
+
+        if not fallback_to_none:
+            raise KeyError(error_text)
+        else:
+            lit_logger.warning(error_text)
+
+    return names if isinstance(input_ids, np.ndarray) else names.tolist()
+
+
+def lookup_names(ids: np.ndarray, locale: str, object_type: str = None) -> np.ndarray:
+    """Returns an object array with the names of the given IDs, None marking IDs that were not found."""
+    table_ids, table_names = lod.get_name_table(locale, object_type)
+
+    names = np.full(ids.shape, None, dtype=object)
+
+    if table_ids.size:
+        positions = np.searchsorted(table_ids, ids).clip(max=table_ids.size - 1)
+        found = table_ids[positions] == ids
+        names[found] = table_names[positions[found]]
+
+    # Riot uses 0 as a "no item" value and -1 as "no ban" value.
+    names[ids <= 0] = ""
+
+    return names
+
+
 class NoMatchingNameFound(Exception):
     pass
 
@@ -104,6 +229,7 @@ def get_id(
     input_locale: str = None,
     object_type: str = None,
     retry: bool = True,
+    patch: str = None,
 ) -> int:
     """Returns the best Riot ID guess for the given name.
 
@@ -115,6 +241,7 @@ def get_id(
         input_locale: The language the input was in.
         object_type: Optional string in ['champion', 'item', 'rune', 'summoner_spell']
         retry: Optional variable specifying if local_data should be reloaded if the object cannot be found.
+        patch: Optional patch the name is from, like '12.4', matched against en_US names of objects at this patch.
 
     Returns:
         The matching object ID.
@@ -128,37 +255,40 @@ def get_id(
         get_id('MF')
         get_id('미스 포츈')
         get_id('Dio')
+        get_id('Ravenous Hunter', patch='12.5')
     """
+    start = time.perf_counter() if metrics.enabled else None
+
     input_str = input_str.lower()
 
     # Handling some Leaguepedia special cases as having an ID of 0, might be stupid and should just raise
-    if (
-        not input_str
-        or input_str == "none"
-        or input_str == "loss of ban"
-        or input_str == "no item"
-    ):
+    if input_str in EMPTY_NAMES:
         return 0
 
+    # If we have the patch, we look the name up in the patch history
+    if patch:
+        object_id = get_simple_id(input_str, patch, object_type, minimum_score)
+
+        if object_id is None:
+            error_text = (
+                f"No object name close enough to '{input_str}' found at patch {patch}."
+            )
+            raise NoMatchingNameFound(error_text)
+
+        return object_id
+
     # We try to directly get the object with the exact input name
-    try:
-        return lod.names_to_id[input_str].id
-    except KeyError:
-        pass
+    name_info = lod.get_name_info(input_str)
+    if name_info:
+        if start is not None:
+            metrics.emit("get_id", time.perf_counter() - start, resolution="exact")
+        return name_info.id
 
     # If we run get_id() with no locale and nothing is loaded, we load english by default.
     if not input_locale and not lod.loaded_locales:
         lod.load_locale("en_US")
 
-    possible_names_to_id = lod.names_to_id
-
-    if object_type:
-        possible_names_to_id = {
-            name: possible_names_to_id[name]
-            for name in possible_names_to_id
-            if possible_names_to_id[name].object_type == object_type
-        }
-
+    locale = None
     if input_locale:
         locale = get_clean_locale(input_locale)
 
@@ -169,28 +299,407 @@ def get_id(
                 input_str, minimum_score, input_locale, object_type, retry=False
             )
 
-        possible_names_to_id = {
-            name: possible_names_to_id[name]
-            for name in possible_names_to_id
-            if possible_names_to_id[name].locale == locale
-        }
+    fuzzy_cache.sync(lod.data_version)
+    cache_key = (input_str, minimum_score, locale, object_type)
 
-    name_guess, score, idx = extractOne(input_str, possible_names_to_id.keys())
+    cached_id = fuzzy_cache.get(cache_key)
+    if cached_id is not None:
+        if start is not None:
+            metrics.emit("get_id", time.perf_counter() - start, resolution="cached")
+        return cached_id
 
-    # TODO Handle multiple objects having the same score (happens with substrings of longer names)
+    # Without an input locale, only names written in the same scripts as the input are scored at first
+    scripts = get_scripts(input_str) if not locale else None
+
+    match = match_name(input_str, minimum_score, locale, object_type, scripts)
+    if match is None and scripts:
+        match = match_name(input_str, minimum_score, locale, object_type)
+
+    if match is None:
+        missing_cache.sync(lod.loaded_version)
+        missing_key = ("get_id",) + cache_key
+
+        if retry and not missing_cache.get(missing_key) and lod.refresh():
+            try:
+                return get_id(
+                    input_str, minimum_score, input_locale, object_type, retry=False
+                )
+            except NoMatchingNameFound:
+                missing_cache.set(missing_key, True)
+                raise
+
+        if start is not None:
+            metrics.emit("get_id", time.perf_counter() - start, resolution="missing")
+
+        error_text = f"No object name close enough to '{input_str}' found."
+        raise NoMatchingNameFound(error_text)
+
+    name_guess, score, idx = match
     lit_logger.info(f"Name guess was {name_guess} from {input_str}")
 
-    if score < minimum_score:
-        if retry:
-            lod.reload_all_locales()
-            return get_id(
-                input_str, minimum_score, input_locale, object_type, retry=False
+    # The indexes the name was matched in might have been replaced since, by data where the name does not exist
+    name_info = lod.names_to_id.get(name_guess)
+    if name_info is None:
+        return get_id(input_str, minimum_score, input_locale, object_type, retry)
+
+    object_id = name_info.id
+    fuzzy_cache.set(cache_key, object_id)
+
+    if start is not None:
+        metrics.emit("get_id", time.perf_counter() - start, resolution="fuzzy")
+
+    return object_id
+
+
+def match_name(
+    input_str: str,
+    minimum_score: int,
+    locale: str = None,
+    object_type: str = None,
+    scripts: FrozenSet[str] = None,
+) -> Optional[Tuple[str, float, int]]:
+    """Returns the (name, score, index) of the best candidate scoring at least minimum_score, or None."""
+    # We first score a shortlist of names sharing the most n-grams with the input
+    shortlist = lod.get_shortlist(input_str, locale, object_type, scripts)
+    if shortlist:
+        match = extractOne(
+            input_str,
+            shortlist,
+            scorer=WRatio,
+            processor=default_process,
+            score_cutoff=max(minimum_score, SHORTLIST_MIN_SCORE),
+        )
+        if match is not None:
+            return match
+
+    # If the shortlist is weak, all candidates are scored, the ones that cannot reach minimum_score being skipped early
+    # Ties (which happen with substrings of longer names) can be inspected with get_id_candidates()
+    return extractOne(
+        input_str,
+        lod.get_candidates(locale, object_type, scripts),
+        scorer=WRatio,
+        processor=default_process,
+        score_cutoff=minimum_score,
+    )
+
+
+Candidate = namedtuple("Candidate", ["id", "object_type", "locale", "name", "score"])
+
+
+def get_id_candidates(
+    input_str: str,
+    k: int = 5,
+    minimum_score: int = 0,
+    input_locale: str = None,
+    object_type: str = None,
+    scorer: Callable = WRatio,
+    processor: Optional[Callable] = default_process,
+) -> List[Candidate]:
+    """Returns the k objects whose names match the input best, for inputs that can be ambiguous.
+
+    Each object appears once, with its best matching name, which makes ties between objects visible.
+
+    Args:
+        input_str: Search string.
+        k: Maximum number of candidates returned.
+        minimum_score: Optional minimum ratio (between 0 and 100) under which names are skipped.
+        input_locale: The language the input was in.
+        object_type: Optional string in ['champion', 'item', 'rune', 'summoner_spell']
+        scorer: A rapidfuzz scorer, like rapidfuzz.fuzz.WRatio or rapidfuzz.fuzz.token_set_ratio.
+        processor: A function applied to the input and the names before scoring them, or None.
+
+    Returns:
+        A list of (id, object_type, locale, name, score) named tuples from the best to the worst score, name being the
+        lowercase name or nickname that matched.
+
+    Raises:
+        ValueError: k is lower than 1, or the locale was not understood properly.
+
+    Usage example:
+        get_id_candidates('hunter', 3)
+        get_id_candidates('Jarvan', object_type='champion', scorer=fuzz.token_set_ratio)
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}.")
+
+    input_str = input_str.lower()
+
+    # If we run get_id_candidates() with no locale and nothing is loaded, we load english by default.
+    if not input_locale and not lod.loaded_locales:
+        lod.load_locale("en_US")
+
+    locale = None
+    if input_locale:
+        locale = get_clean_locale(input_locale)
+        if locale not in lod.loaded_locales:
+            lod.load_locale(locale)
+
+    matches = extract(
+        input_str,
+        lod.get_candidates(locale, object_type),
+        scorer=scorer,
+        processor=processor,
+        limit=None,
+        score_cutoff=minimum_score,
+    )
+
+    names_to_id = lod.names_to_id
+
+    candidates = {}
+    for name, score, idx in matches:
+        name_info = names_to_id.get(name)
+
+        # The data changed since the candidates were read, and they are matched again against the new ones
+        if name_info is None:
+            return get_id_candidates(
+                input_str,
+                k,
+                minimum_score,
+                input_locale,
+                object_type,
+                scorer,
+                processor,
             )
+
+        key = (name_info.id, name_info.object_type)
+
+        if key not in candidates:
+            candidates[key] = Candidate(*name_info, name, score)
+            if len(candidates) == k:
+                break
+
+    return list(candidates.values())
+
+
+def get_ids(
+    input_strs: Iterable[str],
+    minimum_score: int = 75,
+    input_locale: str = None,
+    object_type: str = None,
+    retry: bool = True,
+    fallback_to_none: bool = False,
+    workers: int = 1,
+) -> List[Optional[int]]:
+    """Returns the best Riot ID guess for each of the given names.
+
+    Batch version of get_id(). Inputs are deduplicated, exact names are matched directly and all the remaining names
+    are scored together in a single rapidfuzz cdist() pass.
+
+    Args:
+        input_strs: Search strings.
+        minimum_score: Optional minimum ratio (between 0 and 100) under which a name is considered as not found.
+        input_locale: The language the inputs were in.
+        object_type: Optional string in ['champion', 'item', 'rune', 'summoner_spell']
+        retry: Optional variable specifying if local_data should be reloaded once if some objects cannot be found.
+        fallback_to_none: whether names that cannot be found return None instead of raising.
+        workers: Number of threads used by rapidfuzz for fuzzy matching, -1 using all available cores.
+
+    Returns:
+        The matching object IDs, in the same order as the inputs.
+
+    Raises:
+        NoMatchingNameFound: A string did not score above the minimum_score and fallback_to_none is False.
+        ValueError: The locale was not understood properly.
+
+    Usage example:
+        get_ids(['Miss Fortune', 'MF', 'misfortune'])
+        get_ids(scraped_names, fallback_to_none=True, workers=-1)
+    """
+    input_strs = [input_str.lower() for input_str in input_strs]
+
+    results: Dict[str, Optional[int]] = {}
+    leftovers = []
+
+    # We start by matching exact names, which is much faster than fuzzy matching
+    for input_str in dict.fromkeys(input_strs):
+        name_info = lod.get_name_info(input_str)
+
+        if input_str in EMPTY_NAMES:
+            results[input_str] = 0
+        elif name_info:
+            results[input_str] = name_info.id
         else:
+            leftovers.append(input_str)
+
+    if metrics.enabled:
+        metrics.emit("get_ids", size=len(results), resolution="exact")
+
+    if leftovers:
+        # If we run get_ids() with no locale and nothing is loaded, we load english by default.
+        if not input_locale and not lod.loaded_locales:
+            lod.load_locale("en_US")
+
+        locale = None
+        if input_locale:
+            locale = get_clean_locale(input_locale)
+            if locale not in lod.loaded_locales:
+                lod.load_locale(locale)
+
+        fuzzy_cache.sync(lod.data_version)
+
+        uncached_strs = []
+        for input_str in leftovers:
+            cached_id = fuzzy_cache.get((input_str, minimum_score, locale, object_type))
+            if cached_id is not None:
+                results[input_str] = cached_id
+            else:
+                uncached_strs.append(input_str)
+
+        start = time.perf_counter() if metrics.enabled else None
+
+        matches = fuzzy_match_ids(
+            uncached_strs, minimum_score, locale, object_type, workers
+        )
+
+        if start is not None:
+            metrics.emit(
+                "get_ids", size=len(leftovers) - len(uncached_strs), resolution="cached"
+            )
+            metrics.emit(
+                "get_ids",
+                time.perf_counter() - start,
+                size=len(uncached_strs),
+                resolution="fuzzy",
+            )
+
+        for input_str, object_id in matches.items():
+            fuzzy_cache.set((input_str, minimum_score, locale, object_type), object_id)
+        results.update(matches)
+
+        missing_strs = [
+            input_str for input_str in leftovers if input_str not in results
+        ]
+
+        missing_cache.sync(lod.loaded_version)
+        missing_strs = [
+            input_str
+            for input_str in missing_strs
+            if not missing_cache.get(
+                ("get_id", input_str, minimum_score, locale, object_type)
+            )
+        ]
+
+        if missing_strs and retry and lod.refresh():
+            retried_ids = get_ids(
+                missing_strs,
+                minimum_score,
+                input_locale,
+                object_type,
+                retry=False,
+                fallback_to_none=True,
+                workers=workers,
+            )
+            results.update(zip(missing_strs, retried_ids))
+
+            for input_str, object_id in zip(missing_strs, retried_ids):
+                if object_id is None:
+                    missing_key = (
+                        "get_id",
+                        input_str,
+                        minimum_score,
+                        locale,
+                        object_type,
+                    )
+                    missing_cache.set(missing_key, True)
+
+    output = []
+    for input_str in input_strs:
+        object_id = results.get(input_str)
+
+        if object_id is None:
             error_text = f"No object name close enough to '{input_str}' found."
-            raise NoMatchingNameFound(error_text)
+            if not fallback_to_none:
+                raise NoMatchingNameFound(error_text)
+            lit_logger.warning(error_text)
+
+        output.append(object_id)
+
+    return output
+
+
+def fuzzy_match_ids(
+    input_strs: List[str],
+    minimum_score: int,
+    locale: str = None,
+    object_type: str = None,
+    workers: int = 1,
+) -> Dict[str, int]:
+    """Returns the best ID for each input string whose best name scores at least minimum_score."""
+    # Without an input locale, names are first matched against names written in the same scripts
+    name_guesses = {}
+    if not locale:
+        strs_by_scripts = defaultdict(list)
+        for input_str in input_strs:
+            strs_by_scripts[get_scripts(input_str)].append(input_str)
+
+        for scripts, strs in strs_by_scripts.items():
+            if scripts:
+                candidates = lod.get_candidates(locale, object_type, scripts)
+                name_guesses.update(
+                    batch_fuzzy_match(strs, candidates, minimum_score, workers)
+                )
+
+    candidates = lod.get_candidates(locale, object_type)
+    unmatched_strs = [
+        input_str for input_str in input_strs if input_str not in name_guesses
+    ]
+    name_guesses.update(
+        batch_fuzzy_match(unmatched_strs, candidates, minimum_score, workers)
+    )
+
+    names_to_id = lod.names_to_id
+
+    matches = {}
+    for input_str, name_guess in name_guesses.items():
+        name_info = names_to_id.get(name_guess)
+        if name_info is not None:
+            matches[input_str] = name_info.id
+
+    # Names that were removed from the data since the candidates were read are matched again against the new ones
+    stale_strs = [input_str for input_str in name_guesses if input_str not in matches]
+    if stale_strs:
+        matches.update(
+            fuzzy_match_ids(stale_strs, minimum_score, locale, object_type, workers)
+        )
+
+    return matches
+
+
+def batch_fuzzy_match(
+    input_strs: List[str],
+    names: List[str],
+    minimum_score: int,
+    workers: int = 1,
+) -> Dict[str, str]:
+    """Returns the best name for each input string scoring at least minimum_score against the candidate names."""
+    if not names:
+        return {}
+
+    matches = {}
+
+    # Scoring chunks of inputs at once to keep the (inputs, names) score matrix small
+    for start in range(0, len(input_strs), CDIST_CHUNK_SIZE):
+        chunk = input_strs[start : start + CDIST_CHUNK_SIZE]
+
+        scores = cdist(
+            chunk,
+            names,
+            scorer=WRatio,
+            processor=default_process,
+            score_cutoff=minimum_score,
+            workers=workers,
+        )
+        best_indices = scores.argmax(axis=1)
+
+        for input_str, row, best_idx in zip(chunk, scores, best_indices):
+            if row[best_idx] < minimum_score:
+                continue
+
+            name_guess = names[best_idx]
+            lit_logger.info(f"Name guess was {name_guess} from {input_str}")
+            matches[input_str] = name_guess
 
-    return lod.names_to_id[name_guess].id
+    return matches
 
 
 def get_translation(
@@ -231,6 +740,61 @@ def get_translation(
     )
 
 
+def get_translations(
+    object_names: Iterable[str],
+    output_locale: str = "en_US",
+    minimum_score: int = 75,
+    input_locale: str = None,
+    object_type: str = None,
+    retry: bool = True,
+    fallback_to_none: bool = False,
+    workers: int = 1,
+) -> List[Optional[str]]:
+    """Returns the best translation guess for each of the given names.
+
+    Batch version of get_translation(), relying on get_ids() for name matching.
+
+    Args:
+        object_names: Search strings
+        output_locale: The language to translate to, with 'en_US' as the default value
+        minimum_score: Optional minimum ratio (between 0 and 100) under which a name is considered as not found
+        input_locale: The language the inputs were in
+        object_type: Optional string in ['champion', 'item', 'rune', 'summoner_spell']
+        retry: Optional variable specifying if local_data should be reloaded once if some objects cannot be found
+        fallback_to_none: whether names that cannot be found or translated return None instead of raising
+        workers: Number of threads used by rapidfuzz for fuzzy matching, -1 using all available cores
+
+    Returns:
+        The translated names, in the same order as the inputs
+
+    Raises:
+        NoMatchingNameFound: A string did not score above the minimum_score and fallback_to_none is False
+        KeyError: A matched object has no name in the output locale and fallback_to_none is False
+        ValueError: One of the input locales was not understood properly
+
+    Usage example:
+        get_translations(['미스 포츈', 'MF'])
+        get_translations(['Miss Fortune', 'Blade of the Ruined King'], 'ko_KR')
+    """
+    object_ids = get_ids(
+        object_names,
+        minimum_score,
+        input_locale,
+        object_type,
+        retry,
+        fallback_to_none,
+        workers,
+    )
+
+    translations = {
+        object_id: get_name(object_id, output_locale, fallback_to_none=fallback_to_none)
+        for object_id in set(object_ids)
+        if object_id is not None
+    }
+
+    return [translations.get(object_id) for object_id in object_ids]
+
+
 class VersionedNameGetter:
     def __init__(self, patch: str) -> None:
         self.patch = patch
@@ -241,3 +805,6 @@ class VersionedNameGetter:
             object_type=object_type,
             patch=self.patch,
         )
+
+    def get_id(self, input_str: str, object_type: str = None) -> int:
+        return get_id(input_str, object_type=object_type, patch=self.patch)
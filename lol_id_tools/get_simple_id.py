@@ -1,7 +1,13 @@
-from typing import Dict, TypedDict
-import requests
+import json
+import os
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import Optional, TypedDict
 
 from lol_id_tools import parsing
+from lol_id_tools.logger import lit_logger
+from lol_id_tools.parsing.lol_object_data import save_folder
+from lol_id_tools.parsing.versions import version_resolver
+from lol_id_tools.patch_history import PatchHistory
 
 
 class PatchData(TypedDict):
@@ -11,7 +17,29 @@ class PatchData(TypedDict):
     summoner_spell: dict
 
 
-cache: Dict[str, PatchData] = {}
+# Parsers of each object type of a patch
+patch_parsers = {
+    "champion": parsing.parse_champions,
+    "item": parsing.parse_items,
+    "rune": parsing.parse_runes,
+    "summoner_spell": parsing.parse_summoners,
+}
+
+# Patch data used to be saved as one JSON file per full patch, which is still read when building the history
+patches_folder = os.path.join(save_folder, "patches")
+
+
+def get_patch_data(full_patch: str) -> PatchData:
+    patch_data = load_patch_data(full_patch)
+
+    if patch_data is None:
+        patch_data = download_patch_data(full_patch)
+
+    return patch_data
+
+
+# Names of all objects across patches, stored as intervals of patches during which they did not change
+history = PatchHistory(os.path.join(save_folder, "patch_history.json"), get_patch_data)
 
 
 def get_simple_name(
@@ -19,25 +47,51 @@ def get_simple_name(
     object_type,
     patch,
 ):
-    if patch not in cache:
-        cache[patch] = get_patch_data(patch)
+    return history.get_name(input_id, object_type, version_resolver.resolve(patch))
+
+
+def get_simple_id(
+    input_str: str,
+    patch: str,
+    object_type: str = None,
+    minimum_score: int = 75,
+) -> Optional[int]:
+    return history.get_id(
+        input_str, version_resolver.resolve(patch), object_type, minimum_score
+    )
+
+
+def download_patch_data(full_patch: str) -> PatchData:
+    """Queries all object types of the patch concurrently."""
+    with ThreadPoolExecutor() as executor:
+        futures = {
+            object_type: executor.submit(parser, full_patch)
+            for object_type, parser in patch_parsers.items()
+        }
+
+    return PatchData(
+        **{object_type: future.result() for object_type, future in futures.items()}
+    )
 
-    return cache[patch][object_type][input_id]
 
+def get_patch_location(full_patch: str) -> str:
+    return os.path.join(patches_folder, f"{full_patch}.json")
 
-def get_patch_data(patch: str):
-    patches_list = requests.get(
-        "https://ddragon.leagueoflegends.com/api/versions.json"
-    ).json()
 
+def load_patch_data(full_patch: str) -> Optional[PatchData]:
     try:
-        full_patch = next(p for p in patches_list if p.startswith(patch))
-    except StopIteration:
-        raise ValueError(f"Patch {patch} not found")
+        with open(get_patch_location(full_patch), encoding="utf-8") as file:
+            saved_data = json.load(file)
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        lit_logger.warning(f"Could not read saved data for patch {full_patch}")
+        return None
 
+    # JSON only has string keys
     return PatchData(
-        champion=parsing.parse_champions(full_patch),
-        item=parsing.parse_items(full_patch),
-        rune=parsing.parse_runes(full_patch),
-        summoner_spell=parsing.parse_summoners(full_patch),
+        **{
+            object_type: {int(id_): name for id_, name in objects.items()}
+            for object_type, objects in saved_data.items()
+        }
     )
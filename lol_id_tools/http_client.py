@@ -0,0 +1,128 @@
+import json
+import posixpath
+import re
+import time
+from collections import namedtuple
+from operator import attrgetter
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from lol_id_tools import metrics
+from lol_id_tools.cache import LRUCache
+from lol_id_tools.logger import lit_logger
+
+# size is the number of bytes of the JSON the data was parsed from, or reduced to when it was parsed
+CachedResponse = namedtuple("CachedResponse", ["etag", "last_modified", "data", "size"])
+
+# Data Dragon files of a given version never change, and revalidating them would only keep them in memory
+IMMUTABLE_URL = re.compile(r"/cdn/[\d.]+/")
+
+
+class HttpClient:
+    """An HTTP client used for every Data Dragon and CommunityDragon query.
+
+    Connections are pooled and kept alive between queries, and the responses of previously queried URLs that can
+    change are revalidated with their ETag and Last-Modified headers, an unchanged file only costing a 304 response.
+
+    Args:
+        pool_maxsize: Maximum number of connections kept alive per host
+        timeout: Timeout of each query, in seconds
+        max_retries: Number of times failed connections are retried
+        cache_max_bytes: Maximum size of the responses kept in memory for revalidation, in bytes of JSON
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 32,
+        timeout: float = 30,
+        max_retries: int = 3,
+        cache_max_bytes: int = 1024 * 1024,
+    ):
+        self.timeout = timeout
+        self.responses = LRUCache(maxsize=cache_max_bytes, get_size=attrgetter("size"))
+
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=max_retries)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get_json(self, url: str, parse: Callable[[Any], Any] = None) -> Any:
+        """Returns the parsed JSON at the given URL, which must not be modified as it is shared between calls.
+
+        Args:
+            url: The URL to query
+            parse: A function reducing the JSON to what is needed, applied before it is kept for revalidation. It must
+                be the same for every query of the URL.
+        """
+        cached_response = self.responses.get(url)
+
+        headers = {}
+        if cached_response and cached_response.etag:
+            headers["If-None-Match"] = cached_response.etag
+        if cached_response and cached_response.last_modified:
+            headers["If-Modified-Since"] = cached_response.last_modified
+
+        lit_logger.debug(f"Querying {url}")
+        start = time.perf_counter()
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if metrics.enabled:
+            metrics.emit(
+                "http_fetch",
+                time.perf_counter() - start,
+                size=len(response.content),
+                url=url,
+                file=get_file_name(url),
+                status=response.status_code,
+            )
+
+        if response.status_code == 304 and cached_response:
+            lit_logger.debug(f"{url} was not modified")
+            return cached_response.data
+
+        response.raise_for_status()
+        data = response.json()
+        size = len(response.content)
+
+        if parse is not None:
+            data = parse(data)
+            size = len(json.dumps(data))
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (etag or last_modified) and not IMMUTABLE_URL.search(url):
+            self.responses.set(url, CachedResponse(etag, last_modified, data, size))
+
+        return data
+
+    def close(self):
+        self.session.close()
+
+
+# The client shared by the whole package, which configure_http() replaces
+client = HttpClient()
+
+
+def configure_http(**kwargs):
+    """Replaces the shared HTTP client with one created with the given HttpClient arguments.
+
+    Usage example:
+        configure_http(pool_maxsize=64, timeout=10)
+    """
+    global client
+
+    old_client, client = client, HttpClient(**kwargs)
+    old_client.close()
+
+
+def get_file_name(url: str) -> str:
+    """Returns the name of the queried file without its extension, like champion or versions, whatever its version."""
+    return posixpath.splitext(posixpath.basename(url))[0]
+
+
+def get_json(url: str, parse: Callable[[Any], Any] = None) -> Any:
+    """Queries the given URL with the shared HTTP client and returns the parsed JSON, reduced by parse if given."""
+    return client.get_json(url, parse)
@@ -0,0 +1,208 @@
+"""Instrumentation of lookups, reloads, HTTP queries, and data persistence.
+
+Events are only created when at least one hook is registered, instrumented code checking the module-level enabled
+flag before doing anything else.
+
+Events:
+    get_id: a get_id() resolution, labelled exact, cached, fuzzy, or missing
+    get_ids: names resolved by a get_ids() call, with size the number of unique names of each resolution
+    locale_fuzzy_match: a get_clean_locale() call that had to fuzzy match its input
+    reload: a refresh() after a lookup miss, labelled reloaded, shared, skipped, or deferred to the background
+        refresher, and a new version loaded by the background refresher, labelled background
+    http_fetch: a Data Dragon or CommunityDragon query, with its url, file name like champion or versions, status, and
+        size in bytes
+    data_load, data_save: the loaded data being read from or written to the pickle file or the SQLite store
+    index_rebuild: names_to_id or the indexes derived from it being recalculated
+    locale_diff: a reloaded locale being compared to its previous data, with size the number of objects that changed
+"""
+import threading
+from collections import defaultdict, namedtuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from lol_id_tools.logger import lit_logger
+
+# duration is in seconds and size in bytes, or in number of names for get_ids
+Event = namedtuple("Event", ["name", "duration", "size", "labels"])
+
+# Whether any hook is registered, checked by instrumented code before creating events
+enabled = False
+
+_hooks: List[Callable[[Event], None]] = []
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Callable[[Event], None]):
+    """Registers a function called with every Event, from the thread that emitted it.
+
+    Usage example:
+        add_hook(lambda event: print(event.name, event.duration))
+    """
+    global enabled
+
+    with _hooks_lock:
+        _hooks.append(hook)
+        enabled = True
+
+
+def remove_hook(hook: Callable[[Event], None]):
+    global enabled
+
+    with _hooks_lock:
+        _hooks.remove(hook)
+        enabled = bool(_hooks)
+
+
+def emit(name: str, duration: float = None, size: int = None, **labels):
+    """Calls every hook with a new Event, hooks raising exceptions being logged and ignored."""
+    event = Event(name, duration, size, labels)
+
+    for hook in list(_hooks):
+        try:
+            hook(event)
+        except Exception:
+            lit_logger.exception(f"Metrics hook {hook} failed on {name}")
+
+
+# Upper bounds of the duration histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1, 10)
+
+
+class MetricsRecorder:
+    """A hook aggregating events into counters and duration histograms, which can be exported to Prometheus.
+
+    Args:
+        buckets: Upper bounds of the duration histogram buckets, in seconds
+        ignored_labels: Labels events are not aggregated by, like the url of http_fetch which takes a new value for
+            every version and locale and would create series without bound
+    """
+
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        ignored_labels: Iterable[str] = ("url",),
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.ignored_labels = frozenset(ignored_labels)
+
+        self._lock = threading.Lock()
+        self.counts: Dict[Tuple[str, tuple], int] = defaultdict(int)
+        self.sizes: Dict[Tuple[str, tuple], int] = defaultdict(int)
+        self.durations: Dict[Tuple[str, tuple], float] = defaultdict(float)
+        self.bucket_counts: Dict[Tuple[str, tuple], List[int]] = {}
+
+    def __call__(self, event: Event):
+        labels = (
+            (label, value)
+            for label, value in event.labels.items()
+            if label not in self.ignored_labels
+        )
+        key = (event.name, tuple(sorted(labels)))
+
+        with self._lock:
+            self.counts[key] += 1
+
+            if event.size is not None:
+                self.sizes[key] += event.size
+
+            if event.duration is not None:
+                self.durations[key] += event.duration
+
+                # The last bucket is the +Inf one, counting every event with a duration
+                bucket_counts = self.bucket_counts.setdefault(
+                    key, [0] * (len(self.buckets) + 1)
+                )
+                for index, bucket in enumerate(self.buckets + (float("inf"),)):
+                    if event.duration <= bucket:
+                        bucket_counts[index] += 1
+
+    def get_count(self, name: str, **labels) -> int:
+        """Returns the number of events with the given name and labels, other labels taking any value."""
+        with self._lock:
+            return sum(
+                count
+                for (event_name, event_labels), count in self.counts.items()
+                if event_name == name and labels.items() <= dict(event_labels).items()
+            )
+
+    def clear(self):
+        with self._lock:
+            self.counts.clear()
+            self.sizes.clear()
+            self.durations.clear()
+            self.bucket_counts.clear()
+
+    def to_prometheus(self, prefix: str = "lit") -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            counts = dict(self.counts)
+            sizes = dict(self.sizes)
+            durations = dict(self.durations)
+            bucket_counts = {
+                key: list(value) for key, value in self.bucket_counts.items()
+            }
+
+        lines = []
+
+        for name in sorted({name for name, _ in counts}):
+            metric = f"{prefix}_{name}"
+
+            lines.append(f"# TYPE {metric}_total counter")
+            lines.extend(
+                f"{metric}_total{format_labels(labels)} {count}"
+                for (event_name, labels), count in counts.items()
+                if event_name == name
+            )
+
+            if any(event_name == name for event_name, _ in sizes):
+                lines.append(f"# TYPE {metric}_size_total counter")
+                lines.extend(
+                    f"{metric}_size_total{format_labels(labels)} {size}"
+                    for (event_name, labels), size in sizes.items()
+                    if event_name == name
+                )
+
+            if any(event_name == name for event_name, _ in durations):
+                lines.append(f"# TYPE {metric}_duration_seconds histogram")
+
+                for (event_name, labels), total in durations.items():
+                    if event_name != name:
+                        continue
+
+                    bounds = [format(bucket, "g") for bucket in self.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, bucket_counts[(name, labels)]):
+                        bucket_labels = labels + (("le", bound),)
+                        lines.append(
+                            f"{metric}_duration_seconds_bucket{format_labels(bucket_labels)} {count}"
+                        )
+
+                    lines.append(
+                        f"{metric}_duration_seconds_sum{format_labels(labels)} {total}"
+                    )
+                    lines.append(
+                        f"{metric}_duration_seconds_count{format_labels(labels)} {bucket_counts[(name, labels)][-1]}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels) + "}"
+
+
+def enable_metrics(recorder: Optional[MetricsRecorder] = None) -> MetricsRecorder:
+    """Registers a MetricsRecorder as a hook and returns it.
+
+    Usage example:
+        recorder = enable_metrics()
+        print(recorder.to_prometheus())
+    """
+    recorder = recorder or MetricsRecorder()
+    add_hook(recorder)
+
+    return recorder
@@ -1,5 +1,8 @@
 from lol_id_tools.parsing.parse_ddragon import (
+    get_cdragon_perks_url,
     get_ddragon_url,
+    get_stat_perks,
+    get_versions_url,
     parse_champions,
     parse_items,
     parse_runes,
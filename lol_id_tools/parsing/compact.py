@@ -0,0 +1,252 @@
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import Dict, Iterator, List, Set, Tuple
+
+import numpy as np
+
+# Object types in the order of their codes, which are stored on 4 bits
+object_type_codes = ["champion", "item", "rune", "summoner_spell"]
+_object_type_codes = {
+    object_type: code for code, object_type in enumerate(object_type_codes)
+}
+
+# Locales in the order of their codes, which are given on first use and stored on 12 bits
+_locales: List[str] = []
+_locale_codes: Dict[str, int] = {}
+_locale_codes_lock = threading.Lock()
+
+
+def get_locale_code(locale: str) -> int:
+    code = _locale_codes.get(locale)
+
+    if code is None:
+        with _locale_codes_lock:
+            code = _locale_codes.get(locale)
+            if code is None:
+                code = len(_locales)
+                _locales.append(sys.intern(locale))
+                _locale_codes[locale] = code
+
+    return code
+
+
+class NameInfo(int):
+    """The id, object type, and locale of a name, packed in a single integer.
+
+    It is used like the (id, object_type, locale) named tuple it replaces, while taking less than half its memory. It
+    can be unpacked, indexed, and sliced like one, but it is not a tuple and is not equal to the matching tuple.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, id: int, object_type: str, locale: str):
+        return super().__new__(
+            cls,
+            (id << 16)
+            | (get_locale_code(locale) << 4)
+            | _object_type_codes[object_type],
+        )
+
+    @property
+    def id(self) -> int:
+        return self >> 16
+
+    @property
+    def object_type(self) -> str:
+        return object_type_codes[self & 0xF]
+
+    @property
+    def locale(self) -> str:
+        return _locales[(self >> 4) & 0xFFF]
+
+    def __iter__(self):
+        return iter((self.id, self.object_type, self.locale))
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __len__(self):
+        return 3
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return f"NameInfo(id={self.id}, object_type={self.object_type!r}, locale={self.locale!r})"
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+
+class LocaleTable(Mapping):
+    """The {id: {object_type: name}} objects of a locale, stored as flat arrays of object type codes and interned names.
+
+    Objects are kept in the order of the dict the table was made from, and are found by a binary search on their id.
+    """
+
+    __slots__ = ("ids", "object_types", "names", "_sorted_ids", "_starts", "_counts")
+
+    def __init__(self, locale_data: Mapping):
+        ids = array("q")
+        object_types = array("B")
+        names = []
+
+        for id_, objects in locale_data.items():
+            for object_type, name in objects.items():
+                ids.append(id_)
+                object_types.append(_object_type_codes[object_type])
+                names.append(sys.intern(name))
+
+        # Position of the first object of each id and number of objects, the objects of an id being contiguous
+        starts = {}
+        counts = defaultdict(int)
+        for row, id_ in enumerate(ids):
+            starts.setdefault(id_, row)
+            counts[id_] += 1
+
+        self.ids = ids
+        self.object_types = object_types
+        self.names = tuple(names)
+        self._sorted_ids = array("q", sorted(starts))
+        self._starts = array("q", [starts[id_] for id_ in self._sorted_ids])
+        self._counts = array("B", [counts[id_] for id_ in self._sorted_ids])
+
+    def get(self, id_, default=None):
+        # Inlined as it is on the path of every id -> name lookup
+        sorted_ids = self._sorted_ids
+        position = bisect_left(sorted_ids, id_)
+
+        if position == len(sorted_ids) or sorted_ids[position] != id_:
+            return default
+
+        row = self._starts[position]
+        codes = self.object_types
+        names = self.names
+
+        objects = {object_type_codes[codes[row]]: names[row]}
+        for row in range(row + 1, row + self._counts[position]):
+            objects[object_type_codes[codes[row]]] = names[row]
+
+        return objects
+
+    def __getitem__(self, id_) -> Dict[str, str]:
+        objects = self.get(id_)
+        if objects is None:
+            raise KeyError(id_)
+
+        return objects
+
+    def __contains__(self, id_) -> bool:
+        position = bisect_left(self._sorted_ids, id_)
+        return position < len(self._sorted_ids) and self._sorted_ids[position] == id_
+
+    def __iter__(self) -> Iterator[int]:
+        previous_id = None
+
+        for id_ in self.ids:
+            if id_ != previous_id:
+                yield id_
+                previous_id = id_
+
+    def __len__(self) -> int:
+        return len(self._sorted_ids)
+
+    def iter_items(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Iterates on the (id, {object_type: name}) items in a single pass, without searching any id."""
+        previous_id = None
+        objects = None
+
+        for id_, code, name in zip(self.ids, self.object_types, self.names):
+            if id_ != previous_id:
+                if objects is not None:
+                    yield previous_id, objects
+                previous_id = id_
+                objects = {}
+            objects[object_type_codes[code]] = name
+
+        if objects is not None:
+            yield previous_id, objects
+
+    def items(self):
+        return LocaleTableItems(self)
+
+    def values(self):
+        return LocaleTableValues(self)
+
+    def __eq__(self, other):
+        if isinstance(other, LocaleTable):
+            return (
+                self.ids == other.ids
+                and self.object_types == other.object_types
+                and self.names == other.names
+            ) or dict(self.items()) == dict(other.items())
+
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return f"LocaleTable({len(self)} ids, {len(self.names)} objects)"
+
+
+class LocaleTableItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping.iter_items()
+
+
+class LocaleTableValues(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return (objects for _, objects in self._mapping.iter_items())
+
+
+def compact_locales_data(locales_data: Mapping) -> Dict[str, LocaleTable]:
+    """Returns the {locale: {id: {object_type: name}}} data with each locale as a LocaleTable."""
+    return {
+        locale: locale_data
+        if isinstance(locale_data, LocaleTable)
+        else LocaleTable(locale_data)
+        for locale, locale_data in locales_data.items()
+    }
+
+
+def get_deep_size(obj, seen: Set[int] = None) -> int:
+    """Returns the size in bytes of the object and of everything it references that is not in seen."""
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, np.ndarray):
+            # Object arrays reference Python objects, other arrays own their buffer which getsizeof already counts
+            if obj.dtype == object:
+                stack.extend(obj.tolist())
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, (str, bytes, int, float, array)) or obj is None:
+            continue
+        else:
+            stack.extend(getattr(obj, "__dict__", {}).values())
+            for cls in type(obj).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+
+    return size
@@ -1,27 +1,51 @@
-from lol_id_tools.logger import lit_logger
+from collections import defaultdict
+from typing import Any, Dict
+
 from lol_id_tools import parsing
-import requests
+from lol_id_tools.http_client import get_json
+
+# Files needed to load a locale, the ddragon object types and "perks" for the cdragon perks file
+locale_files = ["champion", "runesReforged", "item", "summoner", "perks"]
+
+
+def get_locale_urls(latest_version, locale: str) -> Dict[str, str]:
+    """Returns the URL of every file needed to load the locale, keyed by file name."""
+    urls = {
+        file_name: parsing.get_ddragon_url(latest_version, locale, file_name)
+        for file_name in locale_files
+        if file_name != "perks"
+    }
+
+    # Cdragon is different enough that it’s handled by itself
+    urls["perks"] = parsing.get_cdragon_perks_url(locale)
+
+    return urls
 
 
-def load_riot_objects(local_data, latest_version, locale: str, object_type: str):
-    """Loads the selected type of objects in the database.
+def query_locale_file(file_name: str, url: str) -> Any:
+    """Queries a file needed to load a locale, only the stat perks of the cdragon perks file being kept."""
+    return get_json(url, parsing.get_stat_perks if file_name == "perks" else None)
 
-    Queries the Riot servers for the local_data then writes it to the database.
-    All three object types are meant to be called together.
+
+def parse_locale_files(files: Dict[str, Any], locale: str) -> Dict[int, Dict[str, str]]:
+    """Parses the queried files of a locale and returns its objects as a {id: {object_type: name}} dict.
 
     Args:
-        local_data: Dictionary to write to
-        latest_version: the latest version available on dd
-        locale: the locale to load
-        object_type: the type of object to load__
+        files: The parsed JSON of each file, keyed by file name
+        locale: the locale of the files
     """
-    url = parsing.get_ddragon_url(latest_version, locale, object_type)
+    local_data = {locale: defaultdict(dict)}
+
+    for file_name in locale_files:
+        if file_name == "perks":
+            parse_cdragon_perks(files[file_name], locale, local_data)
+        else:
+            parse_riot_objects(files[file_name], locale, local_data, file_name)
 
-    lit_logger.debug(f"Querying {url}")
-    response = requests.get(url)
+    return local_data[locale]
 
-    riot_data = response.json()
 
+def parse_riot_objects(riot_data, locale, local_data, object_type: str):
     if object_type == "champion":
         parse_champions(riot_data, locale, local_data)
     elif object_type == "item":
@@ -69,15 +93,7 @@ def parse_summoner_spells(riot_data, locale, local_data):
         ] = summoner_spell_info["name"]
 
 
-def parse_cdragon_runes(local_data, locale):
-    # TODO Clean this up
-    cdragon_locale = locale.lower() if locale != "en_US" else "default"
-    url = f"http://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/{cdragon_locale}/v1/perks.json"
-
-    lit_logger.debug(f"Querying {url}")
-    response = requests.get(url)
-    cdragon_data = response.json()
-
+def parse_cdragon_perks(cdragon_data, locale, local_data):
     for rune in cdragon_data:
         # TODO Get perks only in a cleaner way
         if 5000 < rune["id"] < 5010:
@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """An advisory lock on a file, shared by all the threads and processes of a machine.
+
+    It is reentrant within a thread, so that code holding the lock can call other code taking it.
+
+    Usage example:
+        with FileLock(location):
+            ...
+    """
+
+    def __init__(self, location: str):
+        self.location = location
+
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+
+        if self._depth == 0:
+            try:
+                self.acquire_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+
+        self._depth += 1
+        return self
+
+    def __exit__(self, *_):
+        self._depth -= 1
+
+        try:
+            if self._depth == 0:
+                self.release_file()
+        finally:
+            self._thread_lock.release()
+
+    def acquire_file(self):
+        os.makedirs(os.path.dirname(self.location), exist_ok=True)
+        self._file = open(self.location, "a+b")
+
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            else:
+                # msvcrt only waits about 10 seconds for a lock before raising
+                while True:
+                    try:
+                        self._file.seek(0)
+                        msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.1)
+        except BaseException:
+            self._file.close()
+            self._file = None
+            raise
+
+    def release_file(self):
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
@@ -1,11 +1,13 @@
 import json
 import os
-from collections import namedtuple
+import time
 from typing import Dict
 
 from rapidfuzz.process import extractOne
 
-NameInfo = namedtuple("NameInfo", ["id", "object_type", "locale"])
+from lol_id_tools import metrics
+from lol_id_tools.cache import LRUCache
+from lol_id_tools.parsing.compact import NameInfo
 
 
 def load_nickname_data() -> Dict[str, Dict[str, str]]:
@@ -24,14 +26,60 @@ with open(
     locales_dict = json.load(file)
 
 
+def normalize_locale(locale: str) -> str:
+    """Returns the locale in lowercase, with dashes and spaces replaced by underscores."""
+    return locale.strip().lower().replace("-", "_").replace(" ", "_")
+
+
+def get_locale_aliases() -> Dict[str, str]:
+    """Returns a dict from locale codes, language names, and two-letter language codes to clean locales."""
+    aliases = {}
+
+    for language, locale in locales_dict.items():
+        aliases[locale] = locale
+        aliases[normalize_locale(locale)] = locale
+        aliases[normalize_locale(language)] = locale
+
+    # Two-letter codes go to the locale of the country named like the language if any, and to the first locale else
+    for locale in locales_dict.values():
+        language_code, country_code = locale.split("_")
+        if language_code not in aliases or language_code.upper() == country_code:
+            aliases[language_code] = locale
+
+    return aliases
+
+
+locale_aliases = get_locale_aliases()
+
+# Fuzzy matched inputs that are not aliases, None marking the ones that could not be matched
+fuzzy_locales = LRUCache(maxsize=1024)
+
+
 def get_clean_locale(locale: str):
     """Returns a "clean" locale from a user-entered input."""
-    # We check if the locale is "clean". If not, we match it to our language list.
-    if locale in locales_dict.values():
-        return locale
-
-    matching_language, score, idx = extractOne(locale, locales_dict.keys())
-    if score > 80:
-        return locales_dict[matching_language]
-    else:
+    # We check if the locale is "clean" or a known alias. If not, we match it to our language list.
+    clean_locale = locale_aliases.get(locale) or locale_aliases.get(
+        normalize_locale(locale)
+    )
+    if clean_locale:
+        return clean_locale
+
+    clean_locale = fuzzy_locales.get(locale, False)
+
+    if clean_locale is False:
+        start = time.perf_counter() if metrics.enabled else None
+
+        matching_language, score, idx = extractOne(locale, locales_dict.keys())
+
+        if start is not None:
+            metrics.emit(
+                "locale_fuzzy_match", time.perf_counter() - start, matched=score > 80
+            )
+
+        clean_locale = locales_dict[matching_language] if score > 80 else None
+        fuzzy_locales.set(locale, clean_locale)
+
+    if clean_locale is None:
         raise ValueError("The locale name could not be understood")
+
+    return clean_locale
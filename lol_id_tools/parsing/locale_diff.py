@@ -0,0 +1,61 @@
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+# (id, object_type) of an object in a locale
+ObjectKey = Tuple[int, str]
+
+
+class LocaleDiff(NamedTuple):
+    """The objects of a locale that changed between two loads of its data."""
+
+    locale: str
+    old_version: Optional[str]
+    new_version: Optional[str]
+    added: Dict[ObjectKey, str]
+    removed: Dict[ObjectKey, str]
+    # renamed[(id, object_type)][(old_name, new_name)]
+    renamed: Dict[ObjectKey, Tuple[str, str]]
+
+    @property
+    def size(self) -> int:
+        """Returns the number of objects that changed."""
+        return len(self.added) + len(self.removed) + len(self.renamed)
+
+    def __bool__(self):
+        return self.size > 0
+
+
+def diff_locale_data(
+    locale: str,
+    old_data: Mapping[int, Dict[str, str]],
+    new_data: Mapping[int, Dict[str, str]],
+    old_version: str = None,
+    new_version: str = None,
+) -> LocaleDiff:
+    """Returns the objects added, removed, or renamed between two {id: {object_type: name}} dicts of a locale."""
+    added = {}
+    removed = {}
+    renamed = {}
+
+    for id_, new_objects in new_data.items():
+        old_objects = old_data.get(id_, {})
+
+        # Most objects do not change between patches, which is a single dict comparison
+        if new_objects == old_objects:
+            continue
+
+        for object_type, name in new_objects.items():
+            old_name = old_objects.get(object_type)
+            if old_name is None:
+                added[id_, object_type] = name
+            elif old_name != name:
+                renamed[id_, object_type] = (old_name, name)
+
+        for object_type, old_name in old_objects.items():
+            if object_type not in new_objects:
+                removed[id_, object_type] = old_name
+
+    for id_ in old_data.keys() - new_data.keys():
+        for object_type, old_name in old_data[id_].items():
+            removed[id_, object_type] = old_name
+
+    return LocaleDiff(locale, old_version, new_version, added, removed, renamed)
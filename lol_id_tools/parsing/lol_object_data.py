@@ -1,18 +1,52 @@
+import asyncio
 import os
-import requests
 import pickle
-import logging
+import sys
+import threading
+import time
 
 from concurrent.futures.thread import ThreadPoolExecutor
 from collections import defaultdict
-from typing import Dict
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
+import numpy as np
+
+from lol_id_tools import metrics
+from lol_id_tools.logger import lit_logger
 from lol_id_tools.parsing.local_data_parser import load_nickname_data, NameInfo
-from lol_id_tools.parsing.data_parser import load_riot_objects, parse_cdragon_runes
+from lol_id_tools import http_client
+from lol_id_tools.parsing.data_parser import (
+    get_locale_urls,
+    parse_locale_files,
+    query_locale_file,
+)
+from lol_id_tools.parsing.versions import parse_version, version_resolver
+from lol_id_tools.parsing.sqlite_store import SqliteStore
+from lol_id_tools.parsing.ngram_index import MIN_INDEXED_NAMES, NgramIndex
+from lol_id_tools.parsing.scripts import get_scripts
+from lol_id_tools.parsing.file_lock import FileLock
+from lol_id_tools.parsing.locale_diff import LocaleDiff, diff_locale_data
+from lol_id_tools.parsing.compact import (
+    LocaleTable,
+    compact_locales_data,
+    get_deep_size,
+)
 
+# Created the first time data is saved, so that importing the package never touches the file system
 save_folder = os.path.join(os.path.expanduser("~"), ".config", "lol_id_tools")
-if not os.path.exists(save_folder):
-    os.makedirs(save_folder)
+
+# Object types in order of priority when no object type is given for an ID
+object_types = ["champion", "item", "rune", "summoner_spell"]
 
 
 class LolObjectData:
@@ -23,30 +57,230 @@ class LolObjectData:
 
     data_location = os.path.join(save_folder, "loaded_data.pkl")
 
+    # Held while locales are loaded and saved, so that a single process queries a locale and the others read it from disk
+    file_lock = FileLock(os.path.join(save_folder, "loaded_data.lock"))
+
+    # Guards every modification of the data and of the indexes derived from it
+    _lock = threading.RLock()
+
     # riot_data represents all the data that we got from Riot and is ghost loaded for module loading efficiency
     # it is used directly for id -> name matching
-    # riot_data[locale][id][object_type][NameInfo]
-    _loaded_data = None
+    # Each locale is a read-only LocaleTable storing its names as flat arrays, which are much smaller than nested dicts
+    # riot_data[locale][id][object_type][name]
+    _loaded_data: Optional[Dict[str, LocaleTable]] = None
 
     @property
     def loaded_data(self):
         if self._loaded_data is None:
-            self._loaded_data = self.unpickle_loaded_data()
+            if self.store:
+                start = time.perf_counter()
+                self.locale_loads = self.read_store_loads()
+                self._loaded_data = compact_locales_data(self.store.load_data())
+
+                if metrics.enabled:
+                    metrics.emit(
+                        "data_load", time.perf_counter() - start, backend="sqlite"
+                    )
+            else:
+                self._loaded_data = self.unpickle_loaded_data()
             self.recalculate_names_to_id()
         return self._loaded_data
 
+    # store is an optional SQLite backend replacing the pickle file, which is queried lazily until data changes
+    store: Optional[SqliteStore] = None
+
+    def use_sqlite_store(self, location: str = None):
+        """Switches to the SQLite backend, data being queried lazily from the file at location."""
+        with self._lock:
+            self.store = SqliteStore(
+                location or os.path.join(save_folder, "loaded_data.sqlite")
+            )
+            self._loaded_data = None
+            self._locale_names = {}
+            self._names_to_id = {}
+
+            # Migrating the pickled data the first time the store is used
+            if not self.store.loaded_locales():
+                loaded_data = self.unpickle_loaded_data()
+                if loaded_data:
+                    self._loaded_data = loaded_data
+                    self.recalculate_names_to_id()
+                    self.store.save(loaded_data, self._names_to_id, self.locale_loads)
+                    self._loaded_data = None
+                    self._locale_names = {}
+                    self._names_to_id = {}
+
+            self.recalculate_indexes()
+
+    def save_loaded_data(self, locales: List[str] = None):
+        """Saves the data to the store if there is one and to the pickle file otherwise."""
+        if self.store:
+            start = time.perf_counter()
+            self.store.save(
+                self.loaded_data, self.names_to_id, self.locale_loads, locales
+            )
+
+            if metrics.enabled:
+                metrics.emit("data_save", time.perf_counter() - start, backend="sqlite")
+        else:
+            self.pickle_loaded_data()
+
+    # Version and time of the latest load of each locale, saved with the data so that processes know which is newer
+    # Locales read from files saved by older versions of the package have a None version and a 0 time
+    # locale_loads[locale][LocaleLoad]
+    locale_loads: Dict[str, "LocaleLoad"] = {}
+
+    # (inode, modification time, size) of the pickle file when this process last read or wrote it
+    _saved_signature = None
+
     # Pickling it to minimise web requests
     def pickle_loaded_data(self):
-        with open(self.data_location, "wb+") as file:
-            pickle.dump(self.loaded_data, file)
+        start = time.perf_counter()
+
+        os.makedirs(os.path.dirname(self.data_location), exist_ok=True)
+
+        temporary_location = f"{self.data_location}.{os.getpid()}.tmp"
+
+        # Writing to a temporary file first so that other processes never read a partial file
+        with open(temporary_location, "wb") as file:
+            pickle.dump({"loads": self.locale_loads, "data": self.loaded_data}, file)
+
+        os.replace(temporary_location, self.data_location)
+        self._saved_signature = get_file_signature(self.data_location)
+
+        if metrics.enabled:
+            metrics.emit("data_save", time.perf_counter() - start, backend="pickle")
+
+    def unpickle_loaded_data(self) -> Dict[str, LocaleTable]:
+        start = time.perf_counter()
+
+        # The signature is read first, so that a file replaced while reading it is read again by sync_saved_data()
+        signature = get_file_signature(self.data_location)
 
-    def unpickle_loaded_data(self) -> Dict[str, Dict[int, Dict[str, str]]]:
         try:
             with open(self.data_location, "rb") as file:
-                return pickle.load(file)
+                saved_data = pickle.load(file)
         except FileNotFoundError:
             return {}
 
+        # Files saved by older versions of the package only hold the data
+        if set(saved_data) == {"loads", "data"}:
+            locale_loads, loaded_data = saved_data["loads"], saved_data["data"]
+        else:
+            locale_loads, loaded_data = {}, saved_data
+
+        self.locale_loads = {
+            locale: locale_loads.get(locale, LocaleLoad(None, 0))
+            for locale in loaded_data
+        }
+        self._saved_signature = signature
+
+        # Files saved by older versions of the package also hold plain dicts
+        loaded_data = compact_locales_data(loaded_data)
+
+        if metrics.enabled:
+            metrics.emit("data_load", time.perf_counter() - start, backend="pickle")
+
+        return loaded_data
+
+    def read_store_loads(self) -> Dict[str, "LocaleLoad"]:
+        return {
+            locale: LocaleLoad(*locale_load)
+            for locale, locale_load in self.store.load_locale_loads().items()
+        }
+
+    def sync_saved_data(self) -> List[str]:
+        """Reads the locales other processes loaded since the saved data was last read or written by this one.
+
+        Only locales loaded more recently than in this process are updated, and only their names are recalculated.
+
+        Returns:
+            The locales whose data changed.
+        """
+        # Data that was not ghost loaded yet will be read from disk anyway, only the loads of the store being needed
+        if self._loaded_data is None:
+            if self.store:
+                self.locale_loads = self.read_store_loads()
+            return []
+
+        if not self.store and get_file_signature(self.data_location) in (
+            None,
+            self._saved_signature,
+        ):
+            return []
+
+        with self._lock:
+            current_loads = self.locale_loads
+
+            if self.store:
+                saved_loads = self.read_store_loads()
+            else:
+                saved_data = self.unpickle_loaded_data()
+                saved_loads = self.locale_loads
+
+            newer_locales = [
+                locale
+                for locale in saved_loads
+                if locale not in current_loads
+                or saved_loads[locale].is_newer(current_loads[locale])
+            ]
+
+            # The store is queried for the newer locales only
+            if self.store:
+                saved_data = compact_locales_data(
+                    {
+                        locale: self.store.load_locale_data(locale)
+                        for locale in newer_locales
+                    }
+                )
+
+            updated_locales = [
+                locale
+                for locale in newer_locales
+                if saved_data[locale] != self._loaded_data.get(locale)
+            ]
+
+            # Keeping the loads of the locales only this process has or has loaded more recently
+            self.locale_loads = {
+                **current_loads,
+                **{locale: saved_loads[locale] for locale in newer_locales},
+            }
+
+            if updated_locales:
+                lit_logger.info(
+                    f"Locales updated by another process: {', '.join(updated_locales)}"
+                )
+                self._loaded_data.update(
+                    {locale: saved_data[locale] for locale in updated_locales}
+                )
+                self.recalculate_names_to_id(updated_locales)
+
+            return updated_locales
+
+    def get_outdated_locales(
+        self, locales: List[str], latest_version, requested_at: float
+    ) -> List[str]:
+        """Reads the locales other processes saved and returns the ones that still need to be queried.
+
+        Locales another process loaded at latest_version after requested_at, or that this process had not loaded, are
+        not queried again.
+        """
+        previous_locales = set(self.loaded_locales)
+        self.sync_saved_data()
+
+        outdated_locales = []
+        for locale in locales:
+            locale_load = self.locale_loads.get(locale)
+
+            if (
+                locale_load is None
+                or locale_load.version != latest_version
+                or (locale in previous_locales and locale_load.time < requested_at)
+            ):
+                outdated_locales.append(locale)
+
+        return outdated_locales
+
     # nicknames_data is a dictionary representation of /locale_data/nicknames.json
     # It is not meant to be used directly as names_to_id is what we use for name -> id
     # nickname_data[locale][nickname][clean_name]
@@ -65,80 +299,785 @@ class LolObjectData:
     @property
     def names_to_id(self):
         if not self._names_to_id:
-            self.recalculate_names_to_id()
+            with self._lock:
+                # The store already holds names_to_id, which spares us from loading all the data
+                if self._loaded_data is None and self.store:
+                    self._names_to_id = self.store.load_names_to_id()
+                    self.recalculate_indexes()
+                # Ghost loading loaded_data already calculates names_to_id
+                elif self._loaded_data is None:
+                    _ = self.loaded_data
+                else:
+                    self.recalculate_names_to_id()
         return self._names_to_id
 
+    def get_name_info(self, name: str) -> Optional[NameInfo]:
+        """Returns the names_to_id entry of the lowercase name, if any."""
+        if not self._names_to_id and self._loaded_data is None and self.store:
+            return self.store.get_name_info(name)
+
+        return self.names_to_id.get(name)
+
+    def get_objects(self, locale: str, id_: int) -> Dict[str, str]:
+        """Returns the {object_type: name} dict of the given ID in the given locale."""
+        if self._loaded_data is None and self.store:
+            return self.store.get_objects(locale, id_)
+
+        try:
+            return self.loaded_data[locale].get(id_, {})
+        except KeyError:
+            return {}
+
+    def get_locale_data(self, locale: str) -> Mapping[int, Dict[str, str]]:
+        """Returns the {id: {object_type: name}} mapping of the locale."""
+        if self._loaded_data is None and self.store:
+            return self.store.load_locale_data(locale)
+
+        return self.loaded_data[locale]
+
+    # data_version is incremented every time the data changes, which invalidates results cached from older data
+    data_version = 0
+
+    # locale_names holds the names_to_id entries computed from each locale, in loading order
+    # Later locales take precedence in names_to_id when multiple locales share a name
+    # locale_names[locale][name][NameInfo]
+    _locale_names: Dict[str, Dict[str, NameInfo]] = {}
+
     # get_id() relies a lot on item names, so we also define a reversed dict with lowercase names as property
-    def recalculate_names_to_id(self):
-        for locale in self.loaded_data:
-            # First we write the info from riot_data
-            for id_ in self.loaded_data[locale]:
-                for object_type in self.loaded_data[locale][id_]:
-                    name = self.loaded_data[locale][id_][object_type]
-                    self._names_to_id[name.lower()] = NameInfo(id_, object_type, locale)
-
-            # Then we write the info from nicknames_data if we have loaded the locale
-            if locale in self.nickname_data:
-                for nickname in self.nickname_data[locale]:
-                    clean_name = self.nickname_data[locale][nickname]
-                    object_id = None
-                    object_type = None
-                    for id_ in self.loaded_data[locale]:
-                        for object_type in self.loaded_data[locale][id_]:
-                            if self.loaded_data[locale][id_][object_type] == clean_name:
-                                object_id = id_
-                                break
-
-                    self._names_to_id[nickname.lower()] = NameInfo(
-                        object_id, object_type, locale
-                    )
+    def recalculate_names_to_id(self, locales: List[str] = None):
+        """Recalculates names_to_id and the indexes derived from it.
+
+        Args:
+            locales: the locales whose data changed, with None recalculating everything
+        """
+        with self._lock:
+            if locales is None:
+                locale_names = {}
+                names_to_id = {}
+                locales = list(self.loaded_data)
+                changed_names = None
+            else:
+                # Updating copies, so that concurrent lookups use the previous names until the new ones are swapped in
+                locale_names = dict(self._locale_names)
+                names_to_id = dict(self._names_to_id)
+                changed_names = set()
+
+            start = time.perf_counter()
+
+            for locale in locales:
+                locale_changed_names = self.update_locale_names(
+                    locale, locale_names, names_to_id
+                )
+                if changed_names is not None:
+                    changed_names |= locale_changed_names
+
+            if metrics.enabled:
+                metrics.emit(
+                    "index_rebuild", time.perf_counter() - start, index="names_to_id"
+                )
+
+            self.recalculate_indexes(
+                locale_names,
+                names_to_id,
+                changed_names,
+                None if changed_names is None else locales,
+            )
+
+    def recalculate_indexes(
+        self,
+        locale_names: Dict[str, Dict[str, NameInfo]] = None,
+        names_to_id: Dict[str, NameInfo] = None,
+        changed_names: Set[str] = None,
+        changed_locales: List[str] = None,
+    ):
+        """Recalculates the indexes derived from names_to_id, invalidating results cached from older data.
+
+        Indexes that were already built are built again from the new names before being swapped in with them, so that
+        lookups never wait for them. If the changed names are given, only the indexes they belong to are rebuilt.
+
+        Args:
+            locale_names: the new locale_names, with None keeping the current one
+            names_to_id: the new names_to_id, with None keeping the current one
+            changed_names: the names whose names_to_id entry changed, with None rebuilding all indexes
+            changed_locales: the locales whose data changed, with None rebuilding all id -> name tables
+        """
+        start = time.perf_counter()
+
+        if names_to_id is None:
+            names_to_id = self._names_to_id
+
+        if changed_names is None:
+            candidates = self.calculate_candidates(names_to_id)
+            script_candidates = {
+                (locale, object_type, scripts): [
+                    name
+                    for name in candidates.get((locale, object_type), [])
+                    if get_scripts(name) & scripts
+                ]
+                for locale, object_type, scripts in list(self._script_candidates)
+            }
+            changed_keys = None
+        else:
+            candidates, script_candidates, changed_keys = self.update_candidates(
+                names_to_id, changed_names
+            )
+
+        ngram_indexes = {}
+        for key, ngram_index in list(self._ngram_indexes.items()):
+            locale, object_type, scripts = key
+
+            if changed_keys is not None and (locale, object_type) not in changed_keys:
+                ngram_indexes[key] = ngram_index
+                continue
+
+            names = (
+                script_candidates.get((locale, object_type, scripts))
+                if scripts
+                else candidates.get((locale, object_type))
+            )
+            if names and len(names) >= MIN_INDEXED_NAMES:
+                ngram_indexes[key] = NgramIndex(names)
+
+        name_tables = {
+            key: (
+                self.calculate_name_table(*key)
+                if changed_locales is None or key[0] in changed_locales
+                else name_table
+            )
+            for key, name_table in list(self._name_tables.items())
+        }
+
+        # Lookups only read these attributes, which are replaced one after the other with no I/O in between
+        if locale_names is not None:
+            self._locale_names = locale_names
+        self._names_to_id = names_to_id
+        self._candidates = candidates
+        self._script_candidates = script_candidates
+        self._ngram_indexes = ngram_indexes
+        self._name_tables = name_tables
+        self.data_version += 1
+
+        if metrics.enabled:
+            metrics.emit(
+                "index_rebuild", time.perf_counter() - start, index="candidates"
+            )
+
+    def update_locale_names(
+        self,
+        locale: str,
+        locale_names: Dict[str, Dict[str, NameInfo]],
+        names_to_id: Dict[str, NameInfo],
+    ) -> Set[str]:
+        """Adds or replaces the entries of a single locale in the given locale_names and names_to_id.
+
+        Returns:
+            The names whose names_to_id entry changed.
+        """
+        old_names = locale_names.get(locale, {})
+        new_names = self.calculate_locale_names(locale)
+        locale_names[locale] = new_names
+
+        changed_names = set()
+
+        # Names only this locale provided are handed back to the latest other locale that has them, if any
+        for name in old_names.keys() - new_names.keys():
+            if names_to_id.get(name) != old_names[name]:
+                continue
+
+            del names_to_id[name]
+            changed_names.add(name)
+            for other_names in reversed(list(locale_names.values())):
+                if name in other_names:
+                    names_to_id[name] = other_names[name]
+                    break
+
+        locale_ranks = {locale: rank for rank, locale in enumerate(locale_names)}
+        rank = locale_ranks[locale]
+
+        for name, name_info in new_names.items():
+            current_info = names_to_id.get(name)
+            if current_info == name_info:
+                continue
+
+            if (
+                current_info is None
+                or locale_ranks.get(current_info.locale, -1) <= rank
+            ):
+                names_to_id[name] = name_info
+                changed_names.add(name)
+
+        return changed_names
+
+    def calculate_locale_names(self, locale: str) -> Dict[str, NameInfo]:
+        """Returns the lowercase object names and nicknames of the locale with their NameInfo."""
+        locale_names = {}
+
+        # First we write the info from riot_data, keeping a clean name -> NameInfo dict to resolve nicknames
+        clean_names = {}
+        for id_, objects in self.loaded_data[locale].items():
+            for object_type, name in objects.items():
+                name_info = NameInfo(id_, object_type, locale)
+                # Interning names shares them between the locales that have the same ones
+                locale_names[sys.intern(name.lower())] = name_info
+                clean_names.setdefault(name, name_info)
+
+        # Then we write the info from nicknames_data
+        for nickname, clean_name in self.nickname_data.get(locale, {}).items():
+            try:
+                locale_names[sys.intern(nickname.lower())] = clean_names[clean_name]
+            except KeyError:
+                lit_logger.debug(
+                    f"Nickname {nickname} refers to unknown name {clean_name}"
+                )
+
+        return locale_names
+
+    # candidates are the names_to_id keys partitioned by locale and object type, None meaning "any"
+    # They are what get_id() fuzzy matches against, and are rebuilt every time names_to_id is recalculated
+    # candidates[(locale, object_type)][name]
+    _candidates: Dict[Tuple[Optional[str], Optional[str]], List[str]] = {}
+
+    @staticmethod
+    def calculate_candidates(
+        names_to_id: Dict[str, NameInfo]
+    ) -> Dict[tuple, List[str]]:
+        candidates = defaultdict(list)
+
+        for name, name_info in list(names_to_id.items()):
+            candidates[name_info.locale, name_info.object_type].append(name)
+            candidates[name_info.locale, None].append(name)
+            candidates[None, name_info.object_type].append(name)
+
+        candidates[None, None] = list(names_to_id)
+
+        return dict(candidates)
+
+    def update_candidates(
+        self, names_to_id: Dict[str, NameInfo], changed_names: Set[str]
+    ) -> Tuple[Dict[tuple, List[str]], Dict[tuple, List[str]], Set[tuple]]:
+        """Returns copies of candidates and script_candidates with the changed names moved, and the keys that changed.
+
+        Lists are only copied for the (locale, object_type) keys the changed names were or are now part of.
+        """
+        added = defaultdict(list)
+        removed = defaultdict(set)
+
+        for name in changed_names:
+            old_keys = get_candidate_keys(self._names_to_id.get(name))
+            new_keys = get_candidate_keys(names_to_id.get(name))
+
+            for key in old_keys - new_keys:
+                removed[key].add(name)
+            for key in new_keys - old_keys:
+                added[key].append(name)
+
+        changed_keys = removed.keys() | added.keys()
+
+        candidates = dict(self._candidates)
+        for key in changed_keys:
+            names = candidates.get(key, [])
+            if key in removed:
+                names = [name for name in names if name not in removed[key]]
+            candidates[key] = names + added.get(key, [])
+
+        script_candidates = dict(self._script_candidates)
+        for (locale, object_type, scripts), names in list(script_candidates.items()):
+            key = (locale, object_type)
+            if key not in changed_keys:
+                continue
+
+            if key in removed:
+                names = [name for name in names if name not in removed[key]]
+            script_candidates[locale, object_type, scripts] = names + [
+                name for name in added.get(key, []) if get_scripts(name) & scripts
+            ]
+
+        return candidates, script_candidates, changed_keys
+
+    # script_candidates partition candidates by the scripts their names are written in
+    # They are built on first use and rebuilt every time names_to_id is recalculated
+    # script_candidates[(locale, object_type, scripts)][names]
+    _script_candidates: Dict[tuple, List[str]] = {}
+
+    def get_candidates(
+        self,
+        locale: str = None,
+        object_type: str = None,
+        scripts: FrozenSet[str] = None,
+    ) -> List[str]:
+        """Returns the lowercase names of the given locale and object type, None meaning any locale or object type.
+
+        If scripts is given, only names written in at least one of the scripts are returned.
+        """
+        # Making sure names_to_id and therefore candidates are calculated
+        if not self.names_to_id:
+            return []
+
+        data_version = self.data_version
+        candidates = self._candidates.get((locale, object_type), [])
+
+        if not scripts:
+            return candidates
+
+        key = (locale, object_type, scripts)
+        script_candidates = self._script_candidates.get(key)
+
+        if script_candidates is None:
+            script_candidates = [
+                name for name in candidates if get_scripts(name) & scripts
+            ]
+            self.add_index_entry(
+                "_script_candidates", key, script_candidates, data_version
+            )
+
+        return script_candidates
+
+    # ngram_indexes shortlist the candidates of a (locale, object_type, scripts) key before fuzzy matching
+    # They are built on first use and rebuilt every time names_to_id is recalculated
+    _ngram_indexes: Dict[tuple, NgramIndex] = {}
+
+    def get_ngram_index(
+        self,
+        locale: str = None,
+        object_type: str = None,
+        scripts: FrozenSet[str] = None,
+    ) -> Optional[NgramIndex]:
+        """Returns the n-gram index of the candidates, or None if there are few enough of them to score them all."""
+        key = (locale, object_type, scripts or None)
+        data_version = self.data_version
+        ngram_index = self._ngram_indexes.get(key)
+
+        if ngram_index is None:
+            candidates = self.get_candidates(locale, object_type, scripts)
+            if len(candidates) < MIN_INDEXED_NAMES:
+                return None
+
+            ngram_index = NgramIndex(candidates)
+            self.add_index_entry("_ngram_indexes", key, ngram_index, data_version)
+
+        return ngram_index
+
+    def get_shortlist(
+        self,
+        input_str: str,
+        locale: str = None,
+        object_type: str = None,
+        scripts: FrozenSet[str] = None,
+    ) -> Optional[List[str]]:
+        """Returns the candidates sharing the most n-grams with the input, or None if all candidates should be scored."""
+        ngram_index = self.get_ngram_index(locale, object_type, scripts)
+
+        return ngram_index.shortlist(input_str) if ngram_index else None
+
+    # name_tables are dense (sorted ids, names) arrays used for vectorized id -> name matching
+    # They are built on first use and rebuilt every time names_to_id is recalculated
+    # name_tables[(locale, object_type)][(ids, names)]
+    _name_tables: Dict[Tuple[str, Optional[str]], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def get_name_table(self, locale: str, object_type: str = None):
+        """Returns the sorted IDs of the locale and an array of their matching names.
+
+        If object_type is None, IDs shared by multiple objects map to the name of the highest priority object type.
+        """
+        key = (locale, object_type)
+        data_version = self.data_version
+        name_table = self._name_tables.get(key)
+
+        if name_table is None:
+            name_table = self.calculate_name_table(locale, object_type)
+            self.add_index_entry("_name_tables", key, name_table, data_version)
+
+        return name_table
+
+    def add_index_entry(self, index: str, key: tuple, value, data_version: int):
+        """Adds an entry built on first use to a copy of the index, swapped in unless the data changed since.
+
+        Indexes are never modified in place, as rebuilds iterate on them while lookups run without the lock.
+        """
+        with self._lock:
+            if self.data_version == data_version:
+                setattr(self, index, {**getattr(self, index), key: value})
+
+    def calculate_name_table(
+        self, locale: str, object_type: str = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        id_to_name = {}
+        for id_, objects in self.get_locale_data(locale).items():
+            for type_ in [object_type] if object_type else object_types:
+                if type_ in objects:
+                    id_to_name[id_] = objects[type_]
+                    break
+
+        ids = np.array(sorted(id_to_name), dtype=np.int64)
+        names = np.array([id_to_name[id_] for id_ in ids.tolist()], dtype=object)
+
+        return ids, names
 
     # Defining another property for more readable code
     @property
     def loaded_locales(self):
+        if self._loaded_data is None and self.store:
+            return self.store.loaded_locales()
+
         return [k for k in self.loaded_data]
 
+    # Version of the latest data loaded from ddragon in this process
+    loaded_version = None
+
+    # Minimum number of seconds between two reloads triggered by refresh()
+    reload_interval = 60
+
+    _reload_lock = threading.Lock()
+    _last_reload = None
+
+    # Start of the latest reload triggered by refresh(), which also limits retries while Data Dragon is unreachable
+    _last_reload_attempt = None
+
+    def refresh(self) -> bool:
+        """Reloads all locales after a lookup miss, at most once every reload_interval seconds.
+
+        Concurrent calls wait for a single in-flight reload instead of each starting their own.
+
+        Returns:
+            Whether the data was reloaded after the call started.
+        """
+        requested_at = time.monotonic()
+
+        # The background refresher loads new versions itself, so lookups never wait for a reload
+        wakeup = self._refresher_wakeup
+        if wakeup is not None:
+            wakeup.set()
+            if metrics.enabled:
+                metrics.emit("reload", outcome="deferred")
+            return False
+
+        with self._reload_lock:
+            # Another caller reloaded the data while we were waiting for it
+            if self._last_reload is not None and self._last_reload >= requested_at:
+                if metrics.enabled:
+                    metrics.emit(
+                        "reload", time.monotonic() - requested_at, outcome="shared"
+                    )
+                return True
+
+            # Failed reloads count too, so that callers waiting on one do not all query Data Dragon again in turn
+            last_attempt = max(
+                self._last_reload or float("-inf"),
+                self._last_reload_attempt or float("-inf"),
+            )
+            if requested_at - last_attempt < self.reload_interval:
+                lit_logger.debug("Data reloaded recently, not reloading it again")
+                if metrics.enabled:
+                    metrics.emit("reload", outcome="skipped")
+                return False
+
+            self._last_reload_attempt = time.monotonic()
+
+            # Versions are queried again as a miss might come from a new patch
+            self.reload_all_locales(self.get_latest_version(force=True))
+            self._last_reload = time.monotonic()
+
+            if metrics.enabled:
+                metrics.emit(
+                    "reload", self._last_reload - requested_at, outcome="reloaded"
+                )
+
+            return True
+
+    # Set to wake the background refresher up when it is running, and None otherwise
+    _refresher_wakeup: Optional[threading.Event] = None
+    _refresher_stop: Optional[threading.Event] = None
+
+    def start_background_refresh(self, interval: float = 600):
+        """Starts a daemon thread checking for a new version every interval seconds and loading it in the background.
+
+        Lookups keep using the current data until the new data and its indexes are fully built, and lookup misses
+        wake the thread up instead of reloading the data themselves.
+        """
+        with self._reload_lock:
+            if self._refresher_stop is not None:
+                return
+
+            self._refresher_stop = threading.Event()
+            self._refresher_wakeup = threading.Event()
+
+            threading.Thread(
+                target=self.run_background_refresh,
+                args=(interval, self._refresher_stop, self._refresher_wakeup),
+                name="lol_id_tools_refresher",
+                daemon=True,
+            ).start()
+
+    def stop_background_refresh(self):
+        with self._reload_lock:
+            if self._refresher_stop is None:
+                return
+
+            self._refresher_stop.set()
+            self._refresher_wakeup.set()
+            self._refresher_stop = None
+            self._refresher_wakeup = None
+
+    def run_background_refresh(
+        self, interval: float, stop: threading.Event, wakeup: threading.Event
+    ):
+        last_check = None
+
+        while not stop.is_set():
+            # Lookup misses only trigger a check if the last one is older than reload_interval
+            if last_check is None or time.monotonic() - last_check >= min(
+                interval, self.reload_interval
+            ):
+                last_check = time.monotonic()
+
+                try:
+                    self.revalidate()
+                except Exception:
+                    lit_logger.exception("Background refresh failed")
+
+            wakeup.wait(max(0.0, interval - (time.monotonic() - last_check)))
+            wakeup.clear()
+
+    def revalidate(self) -> bool:
+        """Loads the latest version of the loaded locales that are outdated, without blocking lookups.
+
+        Returns:
+            Whether locales were loaded.
+        """
+        start = time.monotonic()
+        latest_version = self.get_latest_version(force=True)
+
+        outdated_locales = [
+            locale
+            for locale in self.loaded_locales
+            if locale not in self.locale_loads
+            or self.locale_loads[locale].version != latest_version
+        ]
+        if not outdated_locales:
+            return False
+
+        lit_logger.info(f"Loading version {latest_version} in the background")
+        self.load_locales(outdated_locales, latest_version)
+
+        with self._reload_lock:
+            self._last_reload = time.monotonic()
+
+        if metrics.enabled:
+            metrics.emit("reload", time.monotonic() - start, outcome="background")
+
+        return True
+
     def load_locale(self, locale, latest_version=None):
+        self.load_locales([locale], latest_version)
+
+    def load_locales(self, locales: List[str], latest_version=None, max_workers=None):
+        """Queries the locales concurrently, then updates the indexes and saves the data once.
+
+        Args:
+            locales: the locales to load or reload
+            latest_version: the version to load, the latest one by default
+            max_workers: the maximum number of locales queried at the same time
+        """
+        if not locales:
+            return
+
         if not latest_version:
             latest_version = self.get_latest_version()
 
-        self.loaded_data[locale] = defaultdict(dict)
+        requested_at = time.time()
 
-        with ThreadPoolExecutor() as executor:
-            # TODO Just call different functions?
-            for object_type in ["champion", "runesReforged", "item", "summoner"]:
-                executor.submit(
-                    load_riot_objects,
-                    self.loaded_data,
-                    latest_version,
-                    locale,
-                    object_type,
+        with self.file_lock:
+            # Another process might have loaded the locales while we were waiting for the lock
+            locales = self.get_outdated_locales(locales, latest_version, requested_at)
+
+            if not locales:
+                self.loaded_version = latest_version
+                return
+
+            with ThreadPoolExecutor(max_workers) as executor:
+                locales_data = executor.map(
+                    lambda locale: self.download_locale(locale, latest_version),
+                    locales,
                 )
 
-            # Cdragon is different enough that it’s handled by itself
-            executor.submit(parse_cdragon_runes, self.loaded_data, locale)
+            self.set_locales_data(dict(zip(locales, locales_data)), latest_version)
+
+    def set_locales_data(self, locales_data: Dict[str, dict], latest_version):
+        """Adds or replaces the data of the locales, then updates the indexes and saves the data."""
+        with self.file_lock:
+            # Merging the locales other processes saved, which would otherwise be overwritten
+            self.sync_saved_data()
+
+            locales_data = compact_locales_data(locales_data)
+
+            with self._lock:
+                # Reloaded locales are compared to their current data, and only those that changed are recalculated
+                locale_diffs = {
+                    locale: self.diff_locale(locale, locale_data, latest_version)
+                    for locale, locale_data in locales_data.items()
+                    if locale in self.loaded_data
+                }
+                changed_locales = [
+                    locale
+                    for locale in locales_data
+                    if locale not in locale_diffs or locale_diffs[locale]
+                ]
+
+                self.loaded_data.update(locales_data)
+                self.locale_diffs = {**self.locale_diffs, **locale_diffs}
+
+                if changed_locales:
+                    self.recalculate_names_to_id(changed_locales)
+
+                # Versions are updated once the indexes of the new data are swapped in
+                loaded_at = time.time()
+                self.locale_loads = {
+                    **self.locale_loads,
+                    **{
+                        locale: LocaleLoad(latest_version, loaded_at)
+                        for locale in locales_data
+                    },
+                }
+                self.loaded_version = latest_version
+
+                # The saved data also holds the time of each load, which tells other processes it is up to date
+                self.save_loaded_data(changed_locales)
+
+    # Changes of each locale between its two latest loads, LocaleDiff.size being 0 for unchanged locales
+    # locale_diffs[locale][LocaleDiff]
+    locale_diffs: Dict[str, LocaleDiff] = {}
+
+    def diff_locale(self, locale: str, locale_data: dict, latest_version) -> LocaleDiff:
+        """Returns the changes between the loaded data of the locale and its new data."""
+        start = time.perf_counter()
+
+        locale_load = self.locale_loads.get(locale)
+        locale_diff = diff_locale_data(
+            locale,
+            self.loaded_data[locale],
+            locale_data,
+            locale_load.version if locale_load else None,
+            latest_version,
+        )
+
+        if locale_diff:
+            lit_logger.info(
+                f"{locale} {locale_diff.old_version} -> {latest_version}: {len(locale_diff.added)} objects added, "
+                f"{len(locale_diff.removed)} removed, {len(locale_diff.renamed)} renamed"
+            )
+
+        if metrics.enabled:
+            metrics.emit(
+                "locale_diff",
+                time.perf_counter() - start,
+                locale_diff.size,
+                locale=locale,
+            )
+
+        return locale_diff
+
+    # Asynchronous locale loads in progress, keyed by event loop and locale
+    _locale_loads: Dict[Tuple[Any, str], asyncio.Future] = {}
+
+    async def aload_locale(self, locale, latest_version=None):
+        """Asynchronous version of load_locale(), concurrent calls for the same locale sharing a single load."""
+        key = (asyncio.get_running_loop(), locale)
+
+        if key not in self._locale_loads:
+            future = asyncio.ensure_future(
+                self.aload_locale_data(locale, latest_version)
+            )
+            future.add_done_callback(lambda _: self._locale_loads.pop(key, None))
+            self._locale_loads[key] = future
 
-        self.recalculate_names_to_id()
-        self.pickle_loaded_data()
+        # Shielding the load so that a cancelled caller does not cancel it for the others
+        await asyncio.shield(self._locale_loads[key])
 
-    def reload_all_locales(self):
-        self._names_to_id = {}
-        latest_version = self.get_latest_version()
+    async def aload_locale_data(self, locale, latest_version=None):
+        loop = asyncio.get_running_loop()
+        requested_at = time.time()
+
+        if not latest_version:
+            latest_version = await loop.run_in_executor(None, self.get_latest_version)
+
+        # Another process might have loaded the locale already, the file lock only being held to save it
+        if not await loop.run_in_executor(
+            None, self.get_outdated_locales, [locale], latest_version, requested_at
+        ):
+            self.loaded_version = latest_version
+            return
+
+        locale_data = await self.adownload_locale(locale, latest_version)
+
+        # Updating indexes and saving the data is blocking, and therefore done in a thread
+        await loop.run_in_executor(
+            None, self.set_locales_data, {locale: locale_data}, latest_version
+        )
+
+    async def aload_saved_data(self):
+        """Ghost loads the saved data in a thread, as it is the only time reading the data blocks."""
+        if self._loaded_data is None and not self.store:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: self.loaded_data)
+
+    def reload_all_locales(self, latest_version=None):
+        self.load_locales(self.loaded_locales, latest_version)
+
+    @staticmethod
+    def download_locale(locale, latest_version):
+        """Queries all the objects of the locale and returns them as a {id: {object_type: name}} dict."""
+        urls = get_locale_urls(latest_version, locale)
 
         with ThreadPoolExecutor() as executor:
-            for locale in self.loaded_locales:
-                executor.submit(self.load_locale, locale, latest_version)
+            files = dict(
+                zip(urls, executor.map(query_locale_file, urls, urls.values()))
+            )
+
+        return parse_locale_files(files, locale)
+
+    @staticmethod
+    async def adownload_locale(locale, latest_version):
+        """Asynchronous version of download_locale(), querying all files concurrently."""
+        loop = asyncio.get_running_loop()
+        urls = get_locale_urls(latest_version, locale)
+
+        responses = await asyncio.gather(
+            *(
+                loop.run_in_executor(None, query_locale_file, file_name, url)
+                for file_name, url in urls.items()
+            )
+        )
+
+        return parse_locale_files(dict(zip(urls, responses)), locale)
 
     @staticmethod
-    def get_latest_version():
-        """Gets the latest version available on ddragon."""
-        url = "https://ddragon.leagueoflegends.com/api/versions.json"
+    def get_latest_version(force: bool = False):
+        """Gets the latest version available on ddragon, cached for version_resolver.ttl seconds unless forced."""
+        return version_resolver.latest(force)
 
-        response = requests.get(url)
-        logging.debug(f"Querying {url}")
+    def memory_usage(self) -> Dict[str, int]:
+        """Returns the number of bytes used by the data, each of its indexes, the HTTP responses kept for revalidation,
+        and their total.
 
-        data = response.json()
-        return data[0]
+        Objects shared between parts of the data, like interned names, are only counted in the first part using them.
+        """
+        with self._lock:
+            parts = {
+                "loaded_data": self._loaded_data,
+                "names_to_id": self._names_to_id,
+                "locale_names": self._locale_names,
+                "candidates": (self._candidates, self._script_candidates),
+                "ngram_indexes": self._ngram_indexes,
+                "name_tables": self._name_tables,
+                "http_responses": http_client.client.responses,
+            }
+
+            seen = set()
+            usage = {name: get_deep_size(part, seen) for name, part in parts.items()}
+
+        usage["total"] = sum(usage.values())
+
+        return usage
 
     def delete_local_data(self):
         """Mainly used for testing purposes"""
@@ -146,3 +1085,41 @@ class LolObjectData:
             os.remove(self.data_location)
         except FileNotFoundError:
             pass
+
+        if self.store:
+            self.store.delete()
+
+
+def get_file_signature(location: str) -> Optional[Tuple[int, int, int]]:
+    """Returns the (inode, modification time, size) of the file, which changes every time it is replaced."""
+    try:
+        stat = os.stat(location)
+    except FileNotFoundError:
+        return None
+
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def get_candidate_keys(name_info: Optional[NameInfo]) -> Set[tuple]:
+    """Returns the (locale, object_type) candidates keys a names_to_id entry belongs to."""
+    if name_info is None:
+        return set()
+
+    return {
+        (name_info.locale, name_info.object_type),
+        (name_info.locale, None),
+        (None, name_info.object_type),
+        (None, None),
+    }
+
+
+class LocaleLoad(NamedTuple):
+    version: Optional[str]
+    time: float
+
+    def is_newer(self, other: "LocaleLoad") -> bool:
+        """Returns whether this load is of a more recent version, or of the same version at a later time."""
+        return (parse_version(self.version or "") or (), self.time) > (
+            parse_version(other.version or "") or (),
+            other.time,
+        )
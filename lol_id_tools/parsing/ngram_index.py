@@ -0,0 +1,69 @@
+from collections import defaultdict
+from typing import List, Set
+
+import numpy as np
+from rapidfuzz.utils import default_process
+
+# Length of the character n-grams names are indexed on
+NGRAM_SIZE = 3
+
+# Number of names returned by shortlist(), which are then scored with rapidfuzz
+SHORTLIST_SIZE = 64
+
+# Lists with fewer names are scored in full, which is as fast as querying an index
+MIN_INDEXED_NAMES = 500
+
+
+def get_ngrams(name: str) -> Set[str]:
+    """Returns the character n-grams of the processed name, padded with spaces to index its start and end."""
+    padded = f" {default_process(name)} "
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+class NgramIndex:
+    """An inverted index from character n-grams to the names containing them.
+
+    Names sharing the most n-grams with a query are a small shortlist of the names rapidfuzz would score highest,
+    found in a time depending on the number of names sharing n-grams with the query instead of the number of names.
+    """
+
+    def __init__(self, names: List[str]):
+        self.names = names
+
+        postings = defaultdict(list)
+        ngram_counts = np.zeros(len(names), dtype=np.int32)
+
+        for position, name in enumerate(names):
+            ngrams = get_ngrams(name)
+            ngram_counts[position] = len(ngrams)
+
+            for ngram in ngrams:
+                postings[ngram].append(position)
+
+        self.ngram_counts = ngram_counts
+        self.postings = {
+            ngram: np.array(positions, dtype=np.int32)
+            for ngram, positions in postings.items()
+        }
+
+    def shortlist(self, query: str, size: int = SHORTLIST_SIZE) -> List[str]:
+        """Returns up to size names with the highest n-gram overlap with the query, as a Dice coefficient."""
+        ngrams = get_ngrams(query)
+
+        matching_postings = [
+            self.postings[ngram] for ngram in ngrams if ngram in self.postings
+        ]
+        if not matching_postings:
+            return []
+
+        positions, shared_counts = np.unique(
+            np.concatenate(matching_postings), return_counts=True
+        )
+        similarities = 2 * shared_counts / (len(ngrams) + self.ngram_counts[positions])
+
+        if len(positions) > size:
+            best = np.argpartition(similarities, -size)[-size:]
+            # Keeping the order of the names, so that ties are broken as when scoring all of them
+            positions = np.sort(positions[best])
+
+        return [self.names[position] for position in positions.tolist()]
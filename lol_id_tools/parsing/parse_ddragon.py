@@ -1,20 +1,40 @@
 from typing import Dict
 
-import requests
+from lol_id_tools.http_client import get_json
+
+DDRAGON_URL = "https://ddragon.leagueoflegends.com"
+CDRAGON_URL = "http://raw.communitydragon.org"
 
 
 # TODO Move data from ddragon to cdragon to get ID of removed items too
 
 
 def get_ddragon_url(latest_version, locale: str, object_type: str):
-    dd_url = "https://ddragon.leagueoflegends.com"
+    return f"{DDRAGON_URL}/cdn/{latest_version}/data/{locale}/{object_type}.json"
+
+
+def get_versions_url():
+    return f"{DDRAGON_URL}/api/versions.json"
+
+
+def get_cdragon_perks_url(locale: str = "en_US"):
+    cdragon_locale = locale.lower() if locale != "en_US" else "default"
 
-    return f"{dd_url}/cdn/{latest_version}/data/{locale}/{object_type}.json"
+    return f"{CDRAGON_URL}/latest/plugins/rcp-be-lol-game-data/global/{cdragon_locale}/v1/perks.json"
+
+
+def get_stat_perks(cdragon_data: list) -> list:
+    """Returns the stat perks of the cdragon perks file, which are the only perks missing from ddragon."""
+    return [
+        {"id": rune["id"], "name": rune["name"]}
+        for rune in cdragon_data
+        if 5000 < rune["id"] < 5010
+    ]
 
 
 def parse_champions(full_patch: str, locale: str = "en_US") -> Dict[int, str]:
     url = get_ddragon_url(full_patch, locale, "champion")
-    data = requests.get(url).json()
+    data = get_json(url)
 
     return {
         int(champion_dict["key"]): champion_dict["name"]
@@ -24,7 +44,7 @@ def parse_champions(full_patch: str, locale: str = "en_US") -> Dict[int, str]:
 
 def parse_items(full_patch: str, locale: str = "en_US") -> Dict[int, str]:
     url = get_ddragon_url(full_patch, locale, "item")
-    data = requests.get(url).json()
+    data = get_json(url)
 
     result = {}
 
@@ -46,7 +66,7 @@ def parse_items(full_patch: str, locale: str = "en_US") -> Dict[int, str]:
 
 def parse_runes(full_patch: str, locale: str = "en_US") -> Dict[int, str]:
     url = get_ddragon_url(full_patch, locale, "runesReforged")
-    data = requests.get(url).json()
+    data = get_json(url)
 
     result = {}
 
@@ -58,21 +78,15 @@ def parse_runes(full_patch: str, locale: str = "en_US") -> Dict[int, str]:
             for rune in slot["runes"]:
                 result[rune["id"]] = rune["name"]
 
-    cdragon_locale = "default"
-    url = f"http://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/{cdragon_locale}/v1/perks.json"
-
-    cdragon_data = requests.get(url).json()
-
-    for rune in cdragon_data:
-        if 5000 < rune["id"] < 5010:
-            result[rune["id"]] = rune["name"]
+    for rune in get_json(get_cdragon_perks_url(), get_stat_perks):
+        result[rune["id"]] = rune["name"]
 
     return result
 
 
 def parse_summoners(full_patch: str, locale: str = "en_US") -> Dict[int, str]:
     url = get_ddragon_url(full_patch, locale, "summoner")
-    data = requests.get(url).json()
+    data = get_json(url)
 
     return {
         int(data["data"][summoner_spell]["key"]): data["data"][summoner_spell]["name"]
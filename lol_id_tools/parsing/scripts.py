@@ -0,0 +1,20 @@
+import re
+from typing import FrozenSet
+
+# Unicode ranges of the scripts used by Riot locales, kana and han being split as Chinese names have no kana
+script_patterns = {
+    "latin": re.compile(r"[a-zA-Z\u00c0-\u024f\u1e00-\u1eff]"),
+    "hangul": re.compile(r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af]"),
+    "kana": re.compile(r"[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]"),
+    "han": re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]"),
+    "cyrillic": re.compile(r"[\u0400-\u052f]"),
+    "greek": re.compile(r"[\u0370-\u03ff\u1f00-\u1fff]"),
+    "thai": re.compile(r"[\u0e00-\u0e7f]"),
+}
+
+
+def get_scripts(name: str) -> FrozenSet[str]:
+    """Returns the scripts of the letters in the name, which is empty for names without letters."""
+    return frozenset(
+        script for script, pattern in script_patterns.items() if pattern.search(name)
+    )
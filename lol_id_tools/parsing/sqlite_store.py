@@ -0,0 +1,204 @@
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from lol_id_tools.logger import lit_logger
+from lol_id_tools.parsing.local_data_parser import NameInfo
+
+# Bumped every time the layout of the tables changes, older files being rebuilt from scratch
+SCHEMA_VERSION = 2
+
+# Size of the memory map used to read the file, larger than the file itself for a fully loaded instance
+MMAP_SIZE = 256 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS locales (
+    locale TEXT PRIMARY KEY,
+    rank INTEGER NOT NULL,
+    version TEXT,
+    time REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS objects (
+    locale TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    object_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (locale, id, object_type)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS names (
+    name TEXT PRIMARY KEY,
+    id INTEGER NOT NULL,
+    object_type TEXT NOT NULL,
+    locale TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SqliteStore:
+    """A memory-mapped SQLite file holding the loaded data and its precomputed names_to_id index.
+
+    Lookups query the file lazily, so opening it is near-constant time whatever the amount of data, and all the
+    processes of a machine reading the same file share its pages through the OS page cache.
+    """
+
+    def __init__(self, location: str):
+        self.location = location
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # SQLite connections cannot be shared between threads, or inherited by forked processes
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.connection = self.connect()
+            self._local.pid = os.getpid()
+
+        return self._local.connection
+
+    def connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.location)), exist_ok=True)
+
+        connection = sqlite3.connect(self.location, timeout=30)
+        connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+
+        with connection:
+            connection.executescript(SCHEMA)
+            version = connection.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+
+            if version is None or int(version[0]) != SCHEMA_VERSION:
+                lit_logger.info(f"Creating SQLite store at {self.location}")
+                for table in ["locales", "objects", "names"]:
+                    connection.execute(f"DROP TABLE {table}")
+                connection.executescript(SCHEMA)
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+
+        return connection
+
+    def loaded_locales(self) -> List[str]:
+        rows = self.connection.execute("SELECT locale FROM locales ORDER BY rank")
+        return [locale for locale, in rows]
+
+    def load_locale_loads(self) -> Dict[str, Tuple[Optional[str], float]]:
+        """Returns the (version, time) of the latest load of each locale."""
+        rows = self.connection.execute(
+            "SELECT locale, version, time FROM locales ORDER BY rank"
+        )
+        return {locale: (version, time) for locale, version, time in rows}
+
+    def get_objects(self, locale: str, id_: int) -> Dict[str, str]:
+        """Returns the {object_type: name} dict of the given ID."""
+        rows = self.connection.execute(
+            "SELECT object_type, name FROM objects WHERE locale = ? AND id = ?",
+            (locale, id_),
+        )
+        return dict(rows)
+
+    def get_name_info(self, name: str) -> Optional[NameInfo]:
+        """Returns the names_to_id entry of the given lowercase name."""
+        row = self.connection.execute(
+            "SELECT id, object_type, locale FROM names WHERE name = ?", (name,)
+        ).fetchone()
+        return NameInfo(*row) if row else None
+
+    def load_locale_data(self, locale: str) -> Dict[int, Dict[str, str]]:
+        """Returns the {id: {object_type: name}} dict of the locale."""
+        locale_data = defaultdict(dict)
+
+        rows = self.connection.execute(
+            "SELECT id, object_type, name FROM objects WHERE locale = ? ORDER BY id",
+            (locale,),
+        )
+        for id_, object_type, name in rows:
+            locale_data[id_][object_type] = name
+
+        return locale_data
+
+    def load_data(self) -> Dict[str, Dict[int, Dict[str, str]]]:
+        return {
+            locale: self.load_locale_data(locale) for locale in self.loaded_locales()
+        }
+
+    def load_names_to_id(self) -> Dict[str, NameInfo]:
+        rows = self.connection.execute(
+            "SELECT name, id, object_type, locale FROM names"
+        )
+        return {
+            name: NameInfo(id_, object_type, locale)
+            for name, id_, object_type, locale in rows
+        }
+
+    def save(
+        self,
+        loaded_data: Dict[str, Dict[int, Dict[str, str]]],
+        names_to_id: Dict[str, NameInfo],
+        locale_loads: Dict[str, Tuple[Optional[str], float]],
+        locales: List[str] = None,
+    ):
+        """Writes the data in a single transaction.
+
+        loaded_data must hold every locale of the store, as the locales it does not hold are removed from it.
+
+        Args:
+            loaded_data: the data to write
+            names_to_id: the names_to_id index calculated from loaded_data
+            locale_loads: the (version, time) of the latest load of each locale
+            locales: the locales whose objects changed, with None rewriting all of them
+        """
+        if locales is None:
+            locales = list(loaded_data)
+
+        with self.connection as connection:
+            connection.execute("DELETE FROM locales")
+            connection.executemany(
+                "INSERT INTO locales VALUES (?, ?, ?, ?)",
+                [
+                    (locale, rank, *locale_loads.get(locale, (None, 0)))
+                    for rank, locale in enumerate(loaded_data)
+                ],
+            )
+            connection.execute(
+                "DELETE FROM objects WHERE locale NOT IN (SELECT locale FROM locales)"
+            )
+
+            for locale in locales:
+                connection.execute("DELETE FROM objects WHERE locale = ?", (locale,))
+                connection.executemany(
+                    "INSERT INTO objects VALUES (?, ?, ?, ?)",
+                    [
+                        (locale, id_, object_type, name)
+                        for id_, objects in loaded_data[locale].items()
+                        for object_type, name in objects.items()
+                    ],
+                )
+
+            # names_to_id only changes with the objects, the store holding it for all its locales
+            if not locales:
+                return
+
+            connection.execute("DELETE FROM names")
+            connection.executemany(
+                "INSERT INTO names VALUES (?, ?, ?, ?)",
+                [
+                    (name, name_info.id, name_info.object_type, name_info.locale)
+                    for name, name_info in names_to_id.items()
+                ],
+            )
+
+    def delete(self):
+        if hasattr(self._local, "connection"):
+            self._local.connection.close()
+            del self._local.connection
+            del self._local.pid
+
+        for suffix in ["", "-wal", "-shm", "-journal"]:
+            try:
+                os.remove(self.location + suffix)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,119 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+
+from lol_id_tools.http_client import get_json
+from lol_id_tools.parsing.parse_ddragon import get_versions_url
+
+
+def parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """Returns the version as a tuple of integers, or None for legacy versions like 'lolpatch_3.7'."""
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except ValueError:
+        return None
+
+
+class VersionResolver:
+    """Resolves ddragon versions from versions.json, which is queried at most once every ttl seconds.
+
+    Versions are kept sorted, which allows resolving patch prefixes with a binary search.
+    """
+
+    def __init__(self, ttl: float = 600):
+        self.ttl = ttl
+
+        self._latest_version = None
+        # Sorted version keys and the matching versions, replaced together so readers never mix two queries
+        self._index: Tuple[List[Tuple[int, ...]], List[str]] = ([], [])
+        self._queried_at = None
+        self._lock = threading.Lock()
+
+    def update(self, force: bool = False):
+        """Queries versions.json again if it is older than ttl seconds, or if force is True."""
+        with self._lock:
+            if (
+                not force
+                and self._queried_at is not None
+                and time.monotonic() - self._queried_at < self.ttl
+            ):
+                return
+
+            versions = get_json(get_versions_url())
+
+            index = sorted(
+                (parse_version(version), version)
+                for version in versions
+                if parse_version(version)
+            )
+
+            # ddragon lists versions from the most recent to the oldest
+            self._latest_version = versions[0]
+            self._index = (
+                [key for key, version in index],
+                [version for key, version in index],
+            )
+            self._queried_at = time.monotonic()
+
+    def latest(self, force: bool = False) -> str:
+        """Returns the latest version available on ddragon."""
+        self.update(force)
+        return self._latest_version
+
+    def resolve(self, patch: str) -> str:
+        """Returns the most recent full version of the patch, like '12.4.1' for '12.4'.
+
+        Raises:
+            ValueError: The patch was not found in ddragon versions.
+        """
+        key = parse_version(patch)
+        if not key:
+            raise ValueError(f"Patch {patch} not found")
+
+        self.update()
+        version = self.find(key)
+
+        # The patch might have been released since versions.json was last queried
+        if version is None:
+            self.update(force=True)
+            version = self.find(key)
+
+        if version is None:
+            raise ValueError(f"Patch {patch} not found")
+
+        return version
+
+    def resolve_range(self, first_patch: str, last_patch: str) -> List[str]:
+        """Returns the most recent full version of every patch between first_patch and last_patch, both included.
+
+        Raises:
+            ValueError: One of the patches was not found in ddragon versions.
+        """
+        first_version = self.resolve(first_patch)
+        last_version = self.resolve(last_patch)
+
+        keys, versions = self._index
+
+        start = bisect_left(keys, parse_version(first_version))
+        end = bisect_left(keys, parse_version(last_version))
+
+        # Keeping the last version of each patch, like 12.4.1 over 12.4.0
+        patch_versions = {}
+        for key, version in zip(keys[start : end + 1], versions[start : end + 1]):
+            patch_versions[key[:2]] = version
+
+        return list(patch_versions.values())
+
+    def find(self, key: Tuple[int, ...]) -> Optional[str]:
+        keys, versions = self._index
+
+        # Versions starting with key are all between key and the key of the next patch
+        start = bisect_left(keys, key)
+        end = bisect_left(keys, key[:-1] + (key[-1] + 1,))
+
+        return versions[end - 1] if start < end else None
+
+
+# The resolver shared by the whole package
+version_resolver = VersionResolver()
@@ -0,0 +1,391 @@
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from rapidfuzz.fuzz import WRatio
+from rapidfuzz.process import extractOne
+from rapidfuzz.utils import default_process
+
+from lol_id_tools.cache import LRUCache
+from lol_id_tools.logger import lit_logger
+from lol_id_tools.parsing.versions import parse_version
+
+# (first_patch, last_patch, name), patches being positions in PatchHistory.versions
+Interval = Tuple[int, int, str]
+
+# Object types stored in the history, which are the keys of PatchData
+history_object_types = ["champion", "item", "rune", "summoner_spell"]
+
+
+class HistoryState(NamedTuple):
+    """A snapshot of the history, replaced as a whole so that lookups never see a partially updated one."""
+
+    # Full patches in the history, from the oldest to the most recent
+    versions: List[str]
+    # Full patches to their position in versions
+    version_indexes: Dict[str, int]
+    # intervals[object_type][id][(first_patch, last_patch, name)]
+    intervals: Dict[str, Dict[int, List[Interval]]]
+
+
+def get_empty_state() -> HistoryState:
+    return HistoryState(
+        [], {}, {object_type: {} for object_type in history_object_types}
+    )
+
+
+class PatchHistory:
+    """The names of every object across patches, saved as a single JSON file.
+
+    Each (object_type, id) holds a list of (first_patch, last_patch, name) intervals of consecutive patches during which
+    the object kept the same name, so that an unchanged object costs the same whatever the number of patches.
+
+    Args:
+        location: Path of the JSON file
+        get_patch_data: Function returning the PatchData of a full patch, used for patches missing from the history
+        save_interval: Minimum number of seconds between two saves of patches added by lookups
+    """
+
+    def __init__(
+        self,
+        location: str,
+        get_patch_data: Callable[[str], dict],
+        save_interval: float = 10,
+    ):
+        self.location = location
+        self.get_patch_data = get_patch_data
+        self.save_interval = save_interval
+
+        self._lock = threading.RLock()
+        self._loaded = False
+
+        # Patches added by lookups are saved at most once every save_interval seconds, and when the program exits
+        self._saved_at = None
+        self._unsaved = False
+        self._exit_hook = False
+
+        # Lookups read the state once and only use that snapshot, patches being added to a new one swapped in after
+        self._state = get_empty_state()
+
+        # Lowercase names to their (first_patch, last_patch, id, object_type) intervals, with the state they come from
+        self._name_intervals: Optional[
+            Tuple[HistoryState, Dict[str, List[tuple]]]
+        ] = None
+
+        # Lowercase names alive at a (full_patch, object_type), used for fuzzy matching
+        self._patch_names = LRUCache(maxsize=64)
+
+    @property
+    def versions(self) -> List[str]:
+        return self._state.versions
+
+    @property
+    def intervals(self) -> Dict[str, Dict[int, List[Interval]]]:
+        return self._state.intervals
+
+    def load(self):
+        with self._lock:
+            if self._loaded:
+                return
+
+            try:
+                with open(self.location, encoding="utf-8") as file:
+                    saved_history = json.load(file)
+            except FileNotFoundError:
+                saved_history = None
+            except ValueError:
+                lit_logger.warning(
+                    f"Could not read the patch history at {self.location}"
+                )
+                saved_history = None
+
+            if saved_history:
+                versions = saved_history["versions"]
+                self._state = HistoryState(
+                    versions,
+                    {full_patch: index for index, full_patch in enumerate(versions)},
+                    # JSON only has string keys and lists
+                    {
+                        object_type: {
+                            int(id_): [tuple(interval) for interval in intervals]
+                            for id_, intervals in objects.items()
+                        }
+                        for object_type, objects in saved_history["intervals"].items()
+                    },
+                )
+
+            self._loaded = True
+
+    def save(self):
+        self._saved_at = time.monotonic()
+        self._unsaved = False
+
+        os.makedirs(os.path.dirname(self.location), exist_ok=True)
+
+        temporary_location = f"{self.location}.{os.getpid()}.tmp"
+        state = self._state
+
+        # Writing to a temporary file first so that other processes never read a partial file
+        with open(temporary_location, "w", encoding="utf-8") as file:
+            json.dump(
+                {"versions": state.versions, "intervals": state.intervals},
+                file,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+
+        os.replace(temporary_location, self.location)
+
+    def save_later(self):
+        """Saves the history unless it was saved less than save_interval seconds ago, in which case it is saved later."""
+        with self._lock:
+            if (
+                self._saved_at is None
+                or time.monotonic() - self._saved_at >= self.save_interval
+            ):
+                self.save()
+                return
+
+            self._unsaved = True
+            if not self._exit_hook:
+                atexit.register(self.flush)
+                self._exit_hook = True
+
+    def flush(self):
+        """Saves the patches added since the last save, if any."""
+        with self._lock:
+            if self._unsaved:
+                self.save()
+
+    def get_state(self, full_patch: str) -> Tuple[HistoryState, int]:
+        """Returns the current state and the position of the full patch in it, adding the patch if it is missing."""
+        self.load()
+
+        state = self._state
+        patch_index = state.version_indexes.get(full_patch)
+
+        if patch_index is None:
+            # Lookups can walk through many patches in a row, which would otherwise save the history every time
+            self.add_patches([full_patch], save=False)
+            self.save_later()
+            state = self._state
+            patch_index = state.version_indexes[full_patch]
+
+        return state, patch_index
+
+    def add_patches(
+        self, full_patches: Iterable[str], max_workers: int = 4, save: bool = True
+    ):
+        """Adds the full patches missing from the history, querying their data concurrently, and saves it if save is True.
+
+        Each patch is inserted at its position in the history, which only shifts the intervals after it.
+        """
+        self.load()
+
+        with self._lock:
+            state = self._state
+            missing_patches = [
+                p for p in dict.fromkeys(full_patches) if p not in state.version_indexes
+            ]
+            if not missing_patches:
+                return
+
+            with ThreadPoolExecutor(max_workers) as executor:
+                patches_data = dict(
+                    zip(
+                        missing_patches,
+                        executor.map(self.get_patch_data, missing_patches),
+                    )
+                )
+
+            versions = list(state.versions)
+            version_keys = [parse_version(full_patch) for full_patch in versions]
+            intervals = {
+                object_type: dict(objects)
+                for object_type, objects in state.intervals.items()
+            }
+
+            for full_patch in sorted(patches_data, key=parse_version):
+                version_key = parse_version(full_patch)
+                position = bisect_right(version_keys, version_key)
+
+                insert_patch(intervals, patches_data[full_patch], position)
+                versions.insert(position, full_patch)
+                version_keys.insert(position, version_key)
+
+            self._state = HistoryState(
+                versions,
+                {full_patch: index for index, full_patch in enumerate(versions)},
+                intervals,
+            )
+            self._patch_names.clear()
+
+            if save:
+                self.save()
+
+    def get_name(self, input_id: int, object_type: str, full_patch: str) -> str:
+        """Returns the name of the object at the given full patch.
+
+        Raises:
+            KeyError: The object did not exist at this patch.
+        """
+        state, patch_index = self.get_state(full_patch)
+
+        name = find_name(state.intervals[object_type].get(input_id, []), patch_index)
+        if name is None:
+            raise KeyError(
+                f"Riot object with id {input_id} not found at patch {full_patch}."
+            )
+
+        return name
+
+    def get_name_intervals(self, state: HistoryState) -> Dict[str, List[tuple]]:
+        """Returns the (first_patch, last_patch, id, object_type) intervals of each lowercase name of the state."""
+        name_intervals = self._name_intervals
+
+        if name_intervals is None or name_intervals[0] is not state:
+            intervals_by_name = defaultdict(list)
+
+            for object_type, objects in state.intervals.items():
+                for id_, intervals in objects.items():
+                    for first_patch, last_patch, name in intervals:
+                        intervals_by_name[name.lower()].append(
+                            (first_patch, last_patch, id_, object_type)
+                        )
+
+            name_intervals = (state, dict(intervals_by_name))
+            self._name_intervals = name_intervals
+
+        return name_intervals[1]
+
+    def get_id(
+        self,
+        input_str: str,
+        full_patch: str,
+        object_type: str = None,
+        minimum_score: int = 75,
+    ) -> Optional[int]:
+        """Returns the ID of the object with the closest name at the given full patch, None if none is close enough."""
+        state, patch_index = self.get_state(full_patch)
+        name_intervals = self.get_name_intervals(state)
+        input_str = input_str.lower()
+
+        object_id = find_id(name_intervals, input_str, patch_index, object_type)
+        if object_id is not None:
+            return object_id
+
+        # Names alive at a patch never change, so that the cache stays valid when patches are added
+        names = self._patch_names.get((full_patch, object_type))
+        if names is None:
+            names = [
+                name
+                for name, intervals in name_intervals.items()
+                if any(
+                    first <= patch_index <= last
+                    and (object_type is None or type_ == object_type)
+                    for first, last, _, type_ in intervals
+                )
+            ]
+            self._patch_names.set((full_patch, object_type), names)
+
+        match = extractOne(
+            input_str,
+            names,
+            scorer=WRatio,
+            processor=default_process,
+            score_cutoff=minimum_score,
+        )
+        if match is None:
+            return None
+
+        return find_id(name_intervals, match[0], patch_index, object_type)
+
+
+def insert_patch(
+    intervals: Dict[str, Dict[int, List[Interval]]],
+    patch_data: dict,
+    position: int,
+):
+    """Adds a patch to the intervals at the given position in the versions, before it is inserted in them.
+
+    Only the objects of the patch and the objects with intervals after the position are updated. Interval lists are
+    replaced instead of being modified, as they can be shared with the state lookups are using.
+    """
+    for object_type in history_object_types:
+        objects = intervals[object_type]
+        names = patch_data[object_type]
+
+        shifted_ids = [
+            id_
+            for id_, object_intervals in objects.items()
+            if object_intervals[-1][1] >= position
+        ]
+
+        for id_ in set(names).union(shifted_ids):
+            objects[id_] = insert_name(objects.get(id_, []), names.get(id_), position)
+
+
+def insert_name(
+    intervals: List[Interval], name: Optional[str], position: int
+) -> List[Interval]:
+    """Returns the intervals of an object with a patch inserted at the given position, name being None if the object
+    did not exist at this patch.
+    """
+    new_intervals = []
+
+    for first_patch, last_patch, interval_name in intervals:
+        if last_patch < position:
+            new_intervals.append((first_patch, last_patch, interval_name))
+        elif first_patch >= position:
+            new_intervals.append((first_patch + 1, last_patch + 1, interval_name))
+        else:
+            # The interval is split around the new patch, and merged back below if the name did not change
+            new_intervals.append((first_patch, position - 1, interval_name))
+            new_intervals.append((position + 1, last_patch + 1, interval_name))
+
+    if name is not None:
+        index = bisect_left(new_intervals, (position,))
+        new_intervals.insert(index, (position, position, name))
+
+    # Merging consecutive intervals with the same name
+    merged_intervals = []
+    for first_patch, last_patch, interval_name in new_intervals:
+        if (
+            merged_intervals
+            and merged_intervals[-1][1] == first_patch - 1
+            and merged_intervals[-1][2] == interval_name
+        ):
+            merged_intervals[-1] = (merged_intervals[-1][0], last_patch, interval_name)
+        else:
+            merged_intervals.append((first_patch, last_patch, interval_name))
+
+    return merged_intervals
+
+
+def find_id(
+    name_intervals: Dict[str, List[tuple]],
+    name: str,
+    patch_index: int,
+    object_type: str = None,
+) -> Optional[int]:
+    for first_patch, last_patch, id_, type_ in name_intervals.get(name, []):
+        if first_patch <= patch_index <= last_patch and object_type in (None, type_):
+            return id_
+
+    return None
+
+
+def find_name(intervals: List[Interval], patch_index: int) -> Optional[str]:
+    """Returns the name of the interval containing the patch, intervals being sorted and disjoint."""
+    position = bisect_right(intervals, (patch_index, float("inf")))
+
+    if position and intervals[position - 1][1] >= patch_index:
+        return intervals[position - 1][2]
+
+    return None
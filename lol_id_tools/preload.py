@@ -0,0 +1,103 @@
+from typing import List
+
+# Modules loading data are imported in functions, as lol_id_tools imports this one to export preload()
+
+
+def expand_patches(patches: List[str]) -> List[str]:
+    """Returns the full versions of the given patches, which can be ranges like '12.1-12.10'."""
+    from lol_id_tools.parsing.versions import version_resolver
+
+    full_patches = []
+
+    for patch in patches:
+        if "-" in patch:
+            first_patch, last_patch = patch.split("-", 1)
+            full_patches.extend(
+                version_resolver.resolve_range(first_patch.strip(), last_patch.strip())
+            )
+        else:
+            full_patches.append(version_resolver.resolve(patch.strip()))
+
+    return list(dict.fromkeys(full_patches))
+
+
+def preload(
+    locales: List[str] = None,
+    patches: List[str] = None,
+    object_types: List[str] = None,
+    max_workers: int = 4,
+):
+    """Loads locales and patches ahead of time and builds their indexes, so that lookups never wait for them.
+
+    Locales that are already loaded are not queried again, and patches already in the patch history are not queried.
+
+    Args:
+        locales: Locales to load, in any format understood by get_name()
+        patches: Patches to load for versioned lookups, like '12.4', or ranges of patches like '12.1-12.10'
+        object_types: Object types to build id -> name indexes for, in ['champion', 'item', 'rune', 'summoner_spell'],
+            all of them by default. Fuzzy matching indexes are also built for object types that are given.
+        max_workers: Maximum number of locales or patches loaded at the same time
+
+    Raises:
+        ValueError: A locale was not understood properly or a patch was not found.
+
+    Usage example:
+        preload(locales=['ko_KR', 'fr_FR'], patches=['12.1-12.10'])
+    """
+    from lol_id_tools.functions import lod
+    from lol_id_tools.get_simple_id import history
+    from lol_id_tools.parsing.local_data_parser import get_clean_locale
+    from lol_id_tools.parsing.lol_object_data import object_types as all_object_types
+    from lol_id_tools.parsing.scripts import get_scripts
+
+    locales = [get_clean_locale(locale) for locale in locales or []]
+    full_patches = expand_patches(patches or [])
+
+    history.add_patches(full_patches, max_workers=max_workers)
+
+    loaded_locales = lod.loaded_locales
+    lod.load_locales(
+        [locale for locale in locales if locale not in loaded_locales],
+        max_workers=max_workers,
+    )
+
+    # Fuzzy matching candidates are built with names_to_id, n-gram indexes and id -> name tables on first use
+    _ = lod.names_to_id
+
+    # Inputs without a locale are first matched against the names written in their scripts, then against all names
+    names_scripts = {get_scripts(name) for name in lod.get_candidates()}
+    for object_type in [None] + (object_types or []):
+        lod.get_ngram_index(None, object_type)
+        for scripts in names_scripts:
+            if scripts:
+                lod.get_ngram_index(None, object_type, scripts)
+
+    for locale in locales:
+        lod.get_ngram_index(locale)
+        for object_type in [None] + (object_types or all_object_types):
+            lod.get_name_table(locale, object_type)
+
+
+def start_background_refresh(interval: float = 600):
+    """Checks for a new version every interval seconds in a background thread, loading it without blocking lookups.
+
+    Lookups keep being served from the current data until the new data and its indexes are built, and lookup misses
+    wake the background thread up instead of reloading the data themselves.
+
+    Args:
+        interval: Number of seconds between two checks
+
+    Usage example:
+        preload(locales=['ko_KR', 'fr_FR'])
+        start_background_refresh()
+    """
+    from lol_id_tools.functions import lod
+
+    lod.start_background_refresh(interval)
+
+
+def stop_background_refresh():
+    """Stops the background thread, lookup misses reloading the data themselves again."""
+    from lol_id_tools.functions import lod
+
+    lod.stop_background_refresh()
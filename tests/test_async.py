@@ -0,0 +1,24 @@
+import asyncio
+
+import lol_id_tools as lit
+
+
+def test_aget_id():
+    assert asyncio.run(lit.aget_id("Miss Fortune")) == 21
+    assert asyncio.run(lit.aget_id("미스 포츈", input_locale="ko_KR")) == 21
+
+
+def test_aget_translation():
+    assert asyncio.run(lit.aget_translation("Miss Fortune", "ko_KR")) == "미스 포츈"
+
+
+def test_concurrent_locale_load():
+    async def get_names():
+        return await asyncio.gather(
+            *(lit.aget_name(21, "ja_JP", object_type="champion") for _ in range(5))
+        )
+
+    names = asyncio.run(get_names())
+
+    assert len(set(names)) == 1
+    assert "ja_JP" in lit.functions.lod.loaded_locales
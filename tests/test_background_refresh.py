@@ -0,0 +1,118 @@
+import itertools
+import os
+import threading
+import time
+
+import pytest
+
+from lol_id_tools import functions
+
+from lol_id_tools.parsing.file_lock import FileLock
+from lol_id_tools.parsing.lol_object_data import LolObjectData
+from lol_id_tools.parsing.versions import version_resolver
+
+
+def test_background_refresh(tmp_path):
+    lod = LolObjectData()
+    lod.data_location = os.path.join(tmp_path, "loaded_data.pkl")
+    lod.file_lock = FileLock(os.path.join(tmp_path, "loaded_data.lock"))
+
+    latest_version = version_resolver.latest()
+    previous_version = version_resolver.resolve_range("10.1", latest_version)[-2]
+
+    lod.load_locale("en_US", previous_version)
+    lod.get_name_table("en_US", "champion")
+
+    lod.start_background_refresh()
+    try:
+        # Misses are left to the background thread instead of reloading the data
+        assert not lod.refresh()
+
+        for _ in range(100):
+            if lod.locale_loads["en_US"].version == latest_version:
+                break
+            time.sleep(0.1)
+    finally:
+        lod.stop_background_refresh()
+
+    assert lod.locale_loads["en_US"].version == latest_version
+    assert lod.names_to_id["miss fortune"].id == 21
+
+    # Indexes built before the refresh were rebuilt with the new data
+    assert ("en_US", "champion") in lod._name_tables
+
+
+def test_lookups_during_reloads(tmp_path, monkeypatch):
+    lod = LolObjectData()
+    lod.data_location = os.path.join(tmp_path, "loaded_data.pkl")
+    lod.file_lock = FileLock(os.path.join(tmp_path, "loaded_data.lock"))
+    monkeypatch.setattr(functions, "lod", lod)
+
+    latest_version = version_resolver.latest()
+    previous_version = version_resolver.resolve_range("10.1", latest_version)[-2]
+    versions_data = {
+        version: lod.download_locale("en_US", version)
+        for version in [previous_version, latest_version]
+    }
+
+    lod.set_locales_data({"en_US": versions_data[previous_version]}, previous_version)
+
+    # Misspelled names of both versions, which are matched to names the next reload might remove
+    input_strs = [
+        name[:-1] + "#"
+        for locale_data in versions_data.values()
+        for objects in list(locale_data.values())[::10]
+        for name in objects.values()
+        if len(name) > 5
+    ]
+
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        for i in itertools.count():
+            if stop.is_set():
+                return
+            try:
+                input_str = input_strs[i % len(input_strs)]
+                functions.get_ids(input_strs, retry=False, fallback_to_none=True)
+                functions.get_id_candidates(input_str)
+                try:
+                    functions.get_id(input_str, retry=False)
+                except functions.NoMatchingNameFound:
+                    pass
+            except Exception as error:
+                errors.append(error)
+                return
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for version in [latest_version, previous_version] * 20:
+            lod.set_locales_data({"en_US": versions_data[version]}, version)
+    finally:
+        stop.set()
+        reader.join()
+
+    assert errors == []
+
+
+def test_failed_reloads_are_limited(tmp_path):
+    lod = LolObjectData()
+    lod.data_location = os.path.join(tmp_path, "loaded_data.pkl")
+    lod.file_lock = FileLock(os.path.join(tmp_path, "loaded_data.lock"))
+
+    attempts = []
+
+    def reload_all_locales(latest_version=None):
+        attempts.append(latest_version)
+        raise ConnectionError("Data Dragon is unreachable")
+
+    lod.reload_all_locales = reload_all_locales
+
+    with pytest.raises(ConnectionError):
+        lod.refresh()
+
+    # Misses right after a failed reload do not query Data Dragon again
+    assert not lod.refresh()
+    assert len(attempts) == 1
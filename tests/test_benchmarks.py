@@ -0,0 +1,24 @@
+import json
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_benchmarks_run_offline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--quick", "--save", str(baseline)],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+    results = json.loads(baseline.read_text())["results"]
+
+    assert {"get_id_exact", "get_id_fuzzy", "load_locale", "import", "startup"} <= set(
+        results
+    )
+    assert all(result["median"] > 0 for result in results.values())
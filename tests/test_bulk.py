@@ -0,0 +1,60 @@
+import io
+
+from lol_id_tools.bulk import get_mapper, map_rows, translate_csv, translate_jsonl
+
+
+def test_map_rows_dedupes_values():
+    calls = []
+
+    def mapper(values):
+        calls.append(values)
+        return [value.upper() for value in values]
+
+    rows = [{"a": "x", "b": "y"}, {"a": "y", "b": ""}, {"a": "x", "b": "z"}]
+
+    assert list(map_rows(rows, ["a", "b"], mapper, chunk_size=2)) == [
+        {"a": "X", "b": "Y"},
+        {"a": "Y", "b": ""},
+        {"a": "X", "b": "Z"},
+    ]
+    assert calls == [["x", "y"], ["x", "z"]]
+
+
+def test_translate_csv():
+    input_file = io.StringIO("game,champion\n1,Miss Fortune\n2,MF\n3,\n")
+    output_file = io.StringIO()
+
+    translate_csv(input_file, output_file, ["champion"], get_mapper("id"), "_id")
+
+    assert output_file.getvalue() == (
+        "game,champion,champion_id\n1,Miss Fortune,21\n2,MF,21\n3,,\n"
+    )
+
+
+def test_translate_jsonl_patch():
+    input_file = io.StringIO('{"rune": 8135}\n{"rune": 8135}\n')
+    output_file = io.StringIO()
+
+    mapper = get_mapper("name", object_type="rune", patch="12.5")
+    translate_jsonl(input_file, output_file, ["rune"], mapper)
+
+    assert output_file.getvalue() == '{"rune": "Ravenous Hunter"}\n' * 2
+
+
+def test_translate_jsonl_mixed_values():
+    input_file = io.StringIO(
+        '{"champion": "MF"}\n{"champion": 21}\n{"champion": ["MF"]}\n{"champion": {"name": "MF"}}\n{"champion": true}\n'
+    )
+    output_file = io.StringIO()
+
+    translate_jsonl(
+        input_file, output_file, ["champion"], get_mapper("translation"), "_name"
+    )
+
+    assert output_file.getvalue().splitlines() == [
+        '{"champion": "MF", "champion_name": "Miss Fortune"}',
+        '{"champion": 21, "champion_name": null}',
+        '{"champion": ["MF"], "champion_name": null}',
+        '{"champion": {"name": "MF"}, "champion_name": null}',
+        '{"champion": true, "champion_name": null}',
+    ]
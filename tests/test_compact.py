@@ -0,0 +1,51 @@
+import pickle
+
+from lol_id_tools.parsing.compact import LocaleTable, NameInfo, get_deep_size
+from lol_id_tools.parsing.lol_object_data import LolObjectData
+
+
+def test_name_info():
+    name_info = NameInfo(21, "summoner_spell", "ko_KR")
+
+    assert name_info.id == 21
+    assert name_info.object_type == "summoner_spell"
+    assert name_info.locale == "ko_KR"
+    assert tuple(name_info) == (21, "summoner_spell", "ko_KR")
+    assert name_info[0] == 21 and name_info[-1] == "ko_KR"
+    assert name_info[1:] == ("summoner_spell", "ko_KR")
+    assert len(name_info) == 3
+
+    assert name_info == NameInfo(21, "summoner_spell", "ko_KR")
+    assert name_info != NameInfo(21, "champion", "ko_KR")
+    assert pickle.loads(pickle.dumps(name_info)) == name_info
+
+
+def test_locale_table():
+    locale_data = {
+        21: {"champion": "Miss Fortune", "summoner_spell": "Barrier"},
+        1: {"champion": "Annie"},
+        8135: {"rune": "Ravenous Hunter"},
+    }
+    locale_table = LocaleTable(locale_data)
+
+    assert locale_table[21] == locale_data[21]
+    assert locale_table.get(2, {}) == {}
+    assert 8135 in locale_table and 2 not in locale_table
+
+    # The order of the dict is kept, which decides which object gets a name shared by multiple ones
+    assert list(locale_table.items()) == list(locale_data.items())
+    assert locale_table == locale_data
+    assert pickle.loads(pickle.dumps(locale_table)) == locale_table
+
+    assert get_deep_size(locale_table) < get_deep_size(locale_data)
+
+
+def test_memory_usage():
+    lod = LolObjectData()
+    lod.load_locale("en_US")
+
+    usage = lod.memory_usage()
+
+    assert usage["loaded_data"] > 0
+    assert usage["names_to_id"] > 0
+    assert usage["total"] == sum(v for k, v in usage.items() if k != "total")
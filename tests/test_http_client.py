@@ -0,0 +1,37 @@
+from lol_id_tools.http_client import HttpClient
+from lol_id_tools.parsing import (
+    get_cdragon_perks_url,
+    get_ddragon_url,
+    get_stat_perks,
+    get_versions_url,
+)
+from lol_id_tools.parsing.versions import version_resolver
+
+
+def test_revalidated_responses():
+    client = HttpClient()
+
+    champions = client.get_json(
+        get_ddragon_url(version_resolver.latest(), "en_US", "champion")
+    )
+    client.get_json(get_versions_url())
+    stat_perks = client.get_json(get_cdragon_perks_url(), get_stat_perks)
+
+    assert any(champion["key"] == "21" for champion in champions["data"].values())
+    assert stat_perks and all(5000 < perk["id"] < 5010 for perk in stat_perks)
+
+    # Files of a given version never change and are not kept, and only the stat perks of the perks file are
+    assert len(client.responses) == 2
+    assert client.responses.get(get_cdragon_perks_url()).data == stat_perks
+    assert client.responses.cache_info().currsize < 100_000
+
+    # Unchanged files are answered from the kept responses
+    assert client.get_json(get_cdragon_perks_url(), get_stat_perks) == stat_perks
+
+
+def test_responses_bound():
+    client = HttpClient(cache_max_bytes=1)
+
+    client.get_json(get_versions_url())
+
+    assert len(client.responses) == 0
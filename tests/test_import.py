@@ -0,0 +1,38 @@
+import json
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = """
+import json, sys
+import lol_id_tools
+import lol_id_tools.cli
+print(json.dumps([m for m in ("numpy", "rapidfuzz", "requests") if m in sys.modules]))
+"""
+
+
+def test_import_is_lazy(tmp_path):
+    env = dict(os.environ, HOME=str(tmp_path), USERPROFILE=str(tmp_path))
+
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=root,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    # Dependencies are imported and the save folder is created on first use only
+    assert json.loads(output) == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_lazy_attributes():
+    import lol_id_tools as lit
+
+    assert lit.get_id is lit.functions.get_id
+    assert "get_id" in dir(lit)
+    assert lit.metrics is sys.modules["lol_id_tools.metrics"]
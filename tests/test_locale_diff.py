@@ -0,0 +1,75 @@
+import itertools
+import os
+import threading
+
+from lol_id_tools.parsing.file_lock import FileLock
+from lol_id_tools.parsing.locale_diff import diff_locale_data
+from lol_id_tools.parsing.lol_object_data import LolObjectData
+from lol_id_tools.parsing.versions import version_resolver
+
+
+def test_diff_locale_data():
+    old_data = {
+        1: {"champion": "Annie"},
+        21: {"champion": "Miss Fortune", "summoner_spell": "Barrier"},
+        8135: {"rune": "Ravenous Hunter"},
+        1001: {"item": "Boots"},
+    }
+    new_data = {
+        1: {"champion": "Annie"},
+        21: {"champion": "Miss Fortune"},
+        8135: {"rune": "Treasure Hunter"},
+        3153: {"item": "Blade of the Ruined King"},
+    }
+
+    diff = diff_locale_data("en_US", old_data, new_data, "12.5.1", "12.6.1")
+
+    assert diff.added == {(3153, "item"): "Blade of the Ruined King"}
+    assert diff.removed == {(21, "summoner_spell"): "Barrier", (1001, "item"): "Boots"}
+    assert diff.renamed == {(8135, "rune"): ("Ravenous Hunter", "Treasure Hunter")}
+    assert diff.size == 4
+
+    assert not diff_locale_data("en_US", new_data, new_data)
+
+
+def test_diff_reload_with_concurrent_reader(tmp_path):
+    lod = LolObjectData()
+    lod.data_location = os.path.join(tmp_path, "loaded_data.pkl")
+    lod.file_lock = FileLock(os.path.join(tmp_path, "loaded_data.lock"))
+
+    latest_version = version_resolver.latest()
+    previous_version = version_resolver.resolve_range("10.1", latest_version)[-2]
+    versions_data = {
+        version: lod.download_locale("en_US", version)
+        for version in [previous_version, latest_version]
+    }
+
+    lod.set_locales_data({"en_US": versions_data[previous_version]}, previous_version)
+
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        # Every call builds the candidates of a new scripts key, which used to modify indexes rebuilds iterate on
+        for i in itertools.count():
+            if stop.is_set():
+                return
+            try:
+                lod.get_candidates("en_US", None, frozenset([str(i)]))
+                lod.get_name_table("en_US", ["champion", "item"][i % 2])
+            except Exception as error:
+                errors.append(error)
+                return
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for version in [latest_version, previous_version] * 20:
+            lod.set_locales_data({"en_US": versions_data[version]}, version)
+    finally:
+        stop.set()
+        reader.join()
+
+    assert errors == []
+    assert lod.locale_loads["en_US"].version == previous_version
+    assert lod.loaded_data["en_US"] == versions_data[previous_version]
@@ -0,0 +1,25 @@
+import pytest
+
+from lol_id_tools.parsing.local_data_parser import fuzzy_locales, get_clean_locale
+
+
+def test_locale_aliases():
+    assert get_clean_locale("ko_KR") == "ko_KR"
+    assert get_clean_locale("ko-kr") == "ko_KR"
+    assert get_clean_locale("KO_KR") == "ko_KR"
+    assert get_clean_locale("korean") == "ko_KR"
+    assert get_clean_locale("ko") == "ko_KR"
+    assert get_clean_locale("en") == "en_US"
+    assert get_clean_locale("es") == "es_ES"
+    assert get_clean_locale("brazilian portuguese") == "pt_BR"
+
+
+def test_fuzzy_locales():
+    assert get_clean_locale("Koreann ") == "ko_KR"
+    assert fuzzy_locales.get("Koreann ") == "ko_KR"
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            get_clean_locale("klingon")
+
+    assert fuzzy_locales.get("klingon", False) is None
@@ -0,0 +1,66 @@
+import lol_id_tools as lit
+from lol_id_tools import metrics
+from lol_id_tools.http_client import HttpClient
+from lol_id_tools.parsing import get_ddragon_url
+from lol_id_tools.parsing.versions import version_resolver
+
+
+def test_recorder():
+    recorder = metrics.MetricsRecorder(buckets=(0.1, 1))
+
+    recorder(metrics.Event("http_fetch", 0.5, 100, {"status": 200}))
+    recorder(metrics.Event("http_fetch", 2, 50, {"status": 304}))
+
+    assert recorder.get_count("http_fetch") == 2
+    assert recorder.get_count("http_fetch", status=304) == 1
+
+    exported = recorder.to_prometheus()
+
+    assert 'lit_http_fetch_total{status="200"} 1' in exported
+    assert 'lit_http_fetch_size_total{status="304"} 50' in exported
+    assert 'lit_http_fetch_duration_seconds_bucket{status="200",le="0.1"} 0' in exported
+    assert 'lit_http_fetch_duration_seconds_bucket{status="200",le="1"} 1' in exported
+    assert (
+        'lit_http_fetch_duration_seconds_bucket{status="304",le="+Inf"} 1' in exported
+    )
+
+
+def test_get_id_metrics():
+    # Making sure en_US is loaded beforehand
+    lit.get_id("Miss Fortune")
+    lit.fuzzy_cache.clear()
+
+    recorder = lit.enable_metrics()
+
+    try:
+        lit.get_id("Miss Fortune")
+        lit.get_id("missfortune")
+        lit.get_id("missfortune")
+    finally:
+        metrics.remove_hook(recorder)
+
+    assert not metrics.enabled
+
+    assert recorder.get_count("get_id", resolution="exact") == 1
+    assert recorder.get_count("get_id", resolution="fuzzy") == 1
+    assert recorder.get_count("get_id", resolution="cached") == 1
+
+
+def test_http_fetch_metrics():
+    recorder = lit.enable_metrics()
+    events = []
+    metrics.add_hook(events.append)
+
+    try:
+        client = HttpClient()
+        for version in version_resolver.resolve_range("12.4", "12.6"):
+            client.get_json(get_ddragon_url(version, "en_US", "champion"))
+    finally:
+        metrics.remove_hook(recorder)
+        metrics.remove_hook(events.append)
+
+    # Hooks get the url, while the recorder only keeps a series per file
+    assert len({event.labels["url"] for event in events}) == 3
+    assert recorder.get_count("http_fetch", file="champion") == 3
+    assert len(recorder.counts) == 1
+    assert "url=" not in recorder.to_prometheus()
@@ -0,0 +1,10 @@
+from lol_id_tools.parsing.ngram_index import NgramIndex
+
+
+def test_shortlist():
+    names = ["miss fortune", "blade of the ruined king", "fortune's favor", "annie"]
+    index = NgramIndex(names)
+
+    assert index.shortlist("misfortune", size=2) == ["miss fortune", "fortune's favor"]
+    assert index.shortlist("misfortune", size=1) == ["miss fortune"]
+    assert index.shortlist("zzz") == []
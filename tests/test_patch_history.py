@@ -0,0 +1,143 @@
+import json
+import random
+import threading
+
+import pytest
+
+from lol_id_tools.patch_history import PatchHistory
+
+patches = {
+    "12.4.1": {
+        "champion": {1: "Annie"},
+        "item": {},
+        "rune": {8135: "Ravenous Hunter"},
+        "summoner_spell": {},
+    },
+    "12.5.1": {
+        "champion": {1: "Annie"},
+        "item": {},
+        "rune": {8135: "Ravenous Hunter"},
+        "summoner_spell": {},
+    },
+    "12.6.1": {
+        "champion": {1: "Annie"},
+        "item": {},
+        "rune": {8135: "Treasure Hunter"},
+        "summoner_spell": {},
+    },
+}
+
+
+def test_patch_history(tmp_path):
+    location = str(tmp_path / "patch_history.json")
+
+    history = PatchHistory(location, patches.__getitem__)
+    history.add_patches(["12.5.1", "12.6.1"])
+
+    # Adding an older patch inserts it before the others
+    assert history.get_name(8135, "rune", "12.4.1") == "Ravenous Hunter"
+    assert history.versions == ["12.4.1", "12.5.1", "12.6.1"]
+    assert history.intervals["champion"][1] == [(0, 2, "Annie")]
+    assert history.intervals["rune"][8135] == [
+        (0, 1, "Ravenous Hunter"),
+        (2, 2, "Treasure Hunter"),
+    ]
+
+    assert history.get_id("ravenous hunter", "12.5.1") == 8135
+    assert history.get_id("Treasure Huntr", "12.6.1", object_type="rune") == 8135
+    assert history.get_id("Treasure Hunter", "12.6.1", object_type="champion") is None
+
+    # The history is read back from disk without querying any patch
+    saved_history = PatchHistory(location, None)
+    assert saved_history.get_name(8135, "rune", "12.6.1") == "Treasure Hunter"
+
+    with pytest.raises(KeyError):
+        saved_history.get_name(2, "champion", "12.6.1")
+
+
+def test_patch_history_concurrent_lookups(tmp_path):
+    # Every object is renamed each patch, so that any mix of two states of the history returns a wrong name
+    versions = [f"12.{minor}.1" for minor in range(1, 13)]
+    versions_data = {
+        full_patch: {
+            "champion": {id_: f"{id_} {full_patch}" for id_ in range(1, 3000)},
+            "item": {},
+            "rune": {},
+            "summoner_spell": {},
+        }
+        for full_patch in versions
+    }
+
+    history = PatchHistory(str(tmp_path / "patch_history.json"), versions_data.get)
+    history.add_patches(versions[-1:])
+
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            try:
+                assert history.get_name(2999, "champion", "12.12.1") == "2999 12.12.1"
+                assert history.get_id("2999 12.12.1", "12.12.1") == 2999
+                assert history.get_id("2999 12.12.", "12.12.1") == 2999
+            except Exception as error:
+                errors.append(error)
+                return
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        # Older patches are added one at a time, each of them shifting the whole history
+        for full_patch in reversed(versions[:-1]):
+            history.add_patches([full_patch])
+    finally:
+        stop.set()
+        reader.join()
+
+    assert errors == []
+    assert history.versions == versions
+
+
+def test_patch_history_insertion_order(tmp_path):
+    versions = [f"12.{minor}.1" for minor in range(1, 21)]
+    rng = random.Random(0)
+
+    # Objects are renamed, removed, and added back at random patches
+    versions_data = {}
+    for full_patch in versions:
+        versions_data[full_patch] = {
+            "champion": {
+                id_: f"{id_} {rng.randrange(2)}"
+                for id_ in range(1, 50)
+                if rng.random() > 0.2
+            },
+            "item": {},
+            "rune": {},
+            "summoner_spell": {},
+        }
+
+    ordered_history = PatchHistory(
+        str(tmp_path / "ordered_history.json"), versions_data.get
+    )
+    ordered_history.add_patches(versions)
+
+    shuffled_versions = list(versions)
+    rng.shuffle(shuffled_versions)
+
+    location = str(tmp_path / "shuffled_history.json")
+    history = PatchHistory(location, versions_data.get, save_interval=3600)
+    for full_patch in shuffled_versions:
+        history.get_state(full_patch)
+
+    assert history.versions == versions
+    assert history.intervals == ordered_history.intervals
+
+    # Patches added by lookups are saved once, then every save_interval seconds and when flushed
+    with open(location, encoding="utf-8") as file:
+        assert len(json.load(file)["versions"]) == 1
+
+    history.flush()
+
+    saved_history = PatchHistory(location, None)
+    saved_history.load()
+    assert saved_history.intervals == ordered_history.intervals
@@ -0,0 +1,34 @@
+import lol_id_tools as lit
+from lol_id_tools.cli import main
+from lol_id_tools.get_simple_id import history
+from lol_id_tools.preload import expand_patches
+
+
+def test_expand_patches():
+    assert expand_patches(["12.4-12.6"]) == ["12.4.1", "12.5.1", "12.6.1"]
+    assert expand_patches(["12.5", "12.4-12.5"]) == ["12.5.1", "12.4.1"]
+
+
+def test_preload():
+    lit.preload(locales=["en_US", "ko_KR"], patches=["12.5"], object_types=["champion"])
+
+    assert "ko_KR" in lit.functions.lod.loaded_locales
+    assert "12.5.1" in history.versions
+
+    assert lit.get_name(21, "ko_KR", object_type="champion") == "미스 포츈"
+
+    # Fuzzy lookups without a locale use the indexes of the scripts of their input, which were all built
+    lod = lit.functions.lod
+    indexes = (set(lod._script_candidates), set(lod._ngram_indexes))
+    lit.fuzzy_cache.clear()
+
+    assert lit.get_id("misforune") == 21
+    assert lit.get_id("미스포츈") == 21
+    assert (set(lod._script_candidates), set(lod._ngram_indexes)) == indexes
+
+
+def test_warm():
+    main(["warm", "--locales", "fr_FR", "--patches", "12.4-12.5"])
+
+    assert "fr_FR" in lit.functions.lod.loaded_locales
+    assert lit.get_name(8135, object_type="rune", patch="12.5") == "Ravenous Hunter"
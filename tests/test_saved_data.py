@@ -0,0 +1,46 @@
+import os
+import pickle
+
+import lol_id_tools as lit
+from lol_id_tools.parsing.file_lock import FileLock
+from lol_id_tools.parsing.lol_object_data import LolObjectData
+
+
+def get_lod(directory) -> LolObjectData:
+    lod = LolObjectData()
+    lod.data_location = os.path.join(directory, "loaded_data.pkl")
+    lod.file_lock = FileLock(os.path.join(directory, "loaded_data.lock"))
+
+    return lod
+
+
+def test_saved_data_sync(tmp_path):
+    lod = get_lod(tmp_path)
+    lod.load_locale("en_US")
+
+    other_lod = get_lod(tmp_path)
+    assert other_lod.loaded_locales == ["en_US"]
+
+    lod.load_locale("fr_FR")
+
+    # The locale saved by the other instance is read from disk instead of being queried
+    recorder = lit.enable_metrics()
+    try:
+        other_lod.load_locale("fr_FR")
+    finally:
+        lit.metrics.remove_hook(recorder)
+
+    assert recorder.get_count("http_fetch") == 0
+    assert other_lod.loaded_locales == ["en_US", "fr_FR"]
+    assert other_lod.names_to_id["miss fortune"].id == 21
+    assert sorted(os.listdir(tmp_path)) == ["loaded_data.lock", "loaded_data.pkl"]
+
+
+def test_legacy_saved_data(tmp_path):
+    lod = get_lod(tmp_path)
+
+    with open(lod.data_location, "wb") as file:
+        pickle.dump({"en_US": {21: {"champion": "Miss Fortune"}}}, file)
+
+    assert lod.get_objects("en_US", 21) == {"champion": "Miss Fortune"}
+    assert lod.locale_loads["en_US"].version is None
@@ -0,0 +1,12 @@
+from lol_id_tools.parsing.scripts import get_scripts
+
+
+def test_get_scripts():
+    assert get_scripts("Miss Fortune") == {"latin"}
+    assert get_scripts("Maître Yi") == {"latin"}
+    assert get_scripts("착취의 손아귀") == {"hangul"}
+    assert get_scripts("자르반 4세") == {"hangul"}
+    assert get_scripts("ミス・フォーチュン") == {"kana"}
+    assert get_scripts("赏金猎人") == {"han"}
+    assert get_scripts("Мисс Фортуна") == {"cyrillic"}
+    assert get_scripts("4") == set()
@@ -0,0 +1,45 @@
+from lol_id_tools.parsing.lol_object_data import LolObjectData
+
+
+def test_sqlite_store(tmp_path):
+    location = str(tmp_path / "loaded_data.sqlite")
+
+    lod = LolObjectData()
+    lod.use_sqlite_store(location)
+    lod.load_locale("en_US")
+
+    # Another instance reads the file lazily, without loading all the data
+    other_lod = LolObjectData()
+    other_lod.use_sqlite_store(location)
+
+    assert "en_US" in other_lod.loaded_locales
+    assert other_lod.get_objects("en_US", 21)["champion"] == "Miss Fortune"
+    assert other_lod.get_name_info("miss fortune").id == 21
+    assert other_lod._loaded_data is None
+
+
+def test_sqlite_store_shared_by_two_instances(tmp_path):
+    location = str(tmp_path / "loaded_data.sqlite")
+
+    lod = LolObjectData()
+    lod.use_sqlite_store(location)
+    lod.load_locale("en_US")
+
+    other_lod = LolObjectData()
+    other_lod.use_sqlite_store(location)
+    other_lod.load_locale("fr_FR")
+
+    # Saving a locale keeps the locales the other instance saved since
+    lod.load_locale("ko_KR")
+
+    assert {"en_US", "fr_FR", "ko_KR"} <= set(lod.store.loaded_locales())
+    assert lod.get_objects("fr_FR", 21)["champion"] == "Miss Fortune"
+
+    reader = LolObjectData()
+    reader.use_sqlite_store(location)
+
+    assert reader.get_objects("fr_FR", 21)["champion"] == "Miss Fortune"
+    assert reader.get_name_info("미스 포츈").locale == "ko_KR"
+    assert {"en_US", "fr_FR", "ko_KR"} <= {
+        name_info.locale for name_info in reader.names_to_id.values()
+    }
@@ -1,4 +1,7 @@
 from concurrent.futures.thread import ThreadPoolExecutor
+import numpy as np
+import pytest
+
 import lol_id_tools as lit
 
 import os
@@ -96,3 +99,68 @@ def test_parallel_updates():
     with ThreadPoolExecutor() as executor:
         for i in range(0, 5):
             executor.submit(lit.get_id, "nonsense", 100, retry=True)
+
+
+def test_batch_ids():
+    names = ["Miss Fortune", "misforune", "MF", "Blade of the kuined ring", "MF", ""]
+    assert lit.get_ids(names) == [21, 21, 21, 3153, 21, 0]
+
+    assert lit.get_ids(
+        ["Miss Fortune", "zzzzzzzzzzzzzzz"], retry=False, fallback_to_none=True
+    ) == [21, None]
+
+
+def test_batch_translations():
+    assert lit.get_translations(["Miss Fortune", "Grasp of the Undying"], "ko_KR") == [
+        "미스 포츈",
+        "착취의 손아귀",
+    ]
+
+
+def test_batch_names():
+    assert lit.get_names([21, 3153, 8437, 0, -1]) == [
+        "Miss Fortune",
+        "Blade of The Ruined King",
+        "Grasp of the Undying",
+        "",
+        "",
+    ]
+
+    names = lit.get_names(np.array([21, 21]), object_type="summoner_spell")
+    assert names.tolist() == ["Barrier", "Barrier"]
+
+
+def test_fuzzy_cache():
+    lit.fuzzy_cache.clear()
+
+    assert lit.get_id("misforune", object_type="champion") == 21
+    assert lit.get_id("misforune", object_type="champion") == 21
+
+    assert lit.fuzzy_cache.cache_info().hits == 1
+
+
+def test_id_candidates():
+    candidates = lit.get_id_candidates("Miss Fortune", 3)
+
+    assert len(candidates) == 3
+    assert candidates[0].id == 21
+    assert candidates[0].score == 100
+    assert candidates[0].score >= candidates[1].score >= candidates[2].score
+
+    # Each object is returned once, whatever the number of its names and nicknames
+    assert len({(c.id, c.object_type) for c in candidates}) == 3
+
+    assert all(c.score >= 90 for c in lit.get_id_candidates("Miss", minimum_score=90))
+
+    for k in (0, -1):
+        with pytest.raises(ValueError):
+            lit.get_id_candidates("Miss Fortune", k)
+
+
+def test_script_detection():
+    lit.get_id("미스 포츈", input_locale="ko_KR")
+
+    # Hangul inputs are matched against Korean names without giving an input locale
+    assert lit.get_id("착취의 손아귀") == 8437
+    assert lit.get_id("미스포츈") == 21
+    assert lit.get_ids(["미스포츈", "misfortune"]) == [21, 21]
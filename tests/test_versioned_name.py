@@ -3,6 +3,7 @@ import requests
 
 import lol_id_tools
 from lol_id_tools import parsing
+from lol_id_tools.parsing.versions import version_resolver
 
 
 latest_version = requests.get(
@@ -87,3 +88,21 @@ def test_class_12_5():
 
     assert "Annie" == lit.get_name(1, object_type="champion")
     assert "Ravenous Hunter" == lit.get_name(8135, object_type="rune")
+
+
+def test_resolve_patch():
+    assert version_resolver.resolve("12.4") == "12.4.1"
+    # 10.1 must not be confused with 10.10
+    assert version_resolver.resolve("10.1") == "10.1.1"
+
+    with pytest.raises(ValueError):
+        version_resolver.resolve("1.200")
+
+
+def test_get_id_with_patch():
+    assert lol_id_tools.get_id("Ravenous Hunter", patch="12.5") == 8135
+    assert lol_id_tools.get_id("Treasure Hunter", patch="12.6") == 8135
+    assert lol_id_tools.get_id("Annie", object_type="champion", patch="12.3") == 1
+
+    lit = lol_id_tools.VersionedNameGetter("12.6")
+    assert lit.get_id("Treasure Huntr", object_type="rune") == 8135